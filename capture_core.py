@@ -0,0 +1,45 @@
+"""
+Shared GUI session handling for the Tournament Manager entry points.
+Keeps SDL environment setup and GUI construction/teardown in one place.
+"""
+
+import os
+import pygame
+from tournament import TournamentBracketGUI
+
+
+class GUISession:
+    """Context manager that owns a TournamentBracketGUI for one session.
+
+    Configures the SDL drivers (dummy drivers when headless), constructs the
+    GUI, and guarantees pygame is shut down on exit so every entry point
+    initializes and tears down the same way.
+    """
+
+    def __init__(self, width: int = 1400, height: int = 800, headless: bool = False,
+                 hw: bool = False):
+        self.width = width
+        self.height = height
+        self.headless = headless
+        self.hw = hw
+        self.gui = None
+
+    def __enter__(self) -> TournamentBracketGUI:
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        else:
+            # Ask SDL for plain double buffering instead of its default
+            # triple-buffer queue: one frame less latency per flip. Drivers
+            # that don't support the hint just ignore it.
+            os.environ.setdefault("SDL_VIDEO_DOUBLE_BUFFER", "1")
+        # Opt-in: ask SDL for an accelerated, double-buffered display. Not
+        # all drivers honour it, and the dummy driver ignores it entirely.
+        flags = (pygame.HWSURFACE | pygame.DOUBLEBUF) if self.hw else 0
+        self.gui = TournamentBracketGUI(width=self.width, height=self.height,
+                                        flags=flags)
+        return self.gui
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pygame.quit()
+        return False
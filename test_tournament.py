@@ -8,9 +8,17 @@ import os
 import json
 import tempfile
 import shutil
-from pathlib import Path
 from datetime import datetime
-import pygame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Import classes from tournament module
 from tournament import (
@@ -22,17 +30,28 @@ from tournament import (
 )
 
 
+def setUpModule():
+    """Initialize only the pygame subsystems the tests actually use."""
+    global pygame
+    import pygame
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    pygame.font.init()
+
+
+def tearDownModule():
+    pygame.quit()
+
+
 class TestMatch(unittest.TestCase):
     """Test Match dataclass functionality."""
     
     def test_match_creation(self):
         """Test creating a match."""
         match = Match(match_id=1, player1="Alice", player2="Bob", round_num=1)
-        self.assertEqual(match.match_id, 1)
-        self.assertEqual(match.player1, "Alice")
-        self.assertEqual(match.player2, "Bob")
-        self.assertIsNone(match.winner)
-        self.assertEqual(match.round_num, 1)
+        self.assertEqual(
+            (match.match_id, match.player1, match.player2, match.winner, match.round_num),
+            (1, "Alice", "Bob", None, 1))
     
     def test_set_winner_valid(self):
         """Test setting a valid winner."""
@@ -57,7 +76,12 @@ class TestMatch(unittest.TestCase):
 
 class TestTournamentMetadata(unittest.TestCase):
     """Test TournamentMetadata functionality."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """One timestamp for the whole class; the exact value is irrelevant."""
+        cls.NOW_ISO = datetime.now().isoformat()
+
     def test_metadata_creation(self):
         """Test creating tournament metadata."""
         metadata = TournamentMetadata(
@@ -66,10 +90,10 @@ class TestTournamentMetadata(unittest.TestCase):
             location="Test Arena",
             date_scheduled="2026-01-15",
             time_scheduled="14:00",
-            date_created=datetime.now().isoformat()
+            date_created=self.NOW_ISO
         )
-        self.assertEqual(metadata.name, "Test Tournament")
-        self.assertEqual(metadata.location, "Test Arena")
+        self.assertEqual((metadata.name, metadata.location),
+                         ("Test Tournament", "Test Arena"))
     
     def test_metadata_to_dict(self):
         """Test converting metadata to dictionary."""
@@ -79,7 +103,7 @@ class TestTournamentMetadata(unittest.TestCase):
             location="Test Arena",
             date_scheduled="2026-01-15",
             time_scheduled="14:00",
-            date_created=datetime.now().isoformat()
+            date_created=self.NOW_ISO
         )
         data = metadata.to_dict()
         self.assertIsInstance(data, dict)
@@ -94,7 +118,7 @@ class TestTournamentMetadata(unittest.TestCase):
             "location": "Test Arena",
             "date_scheduled": "2026-01-15",
             "time_scheduled": "14:00",
-            "date_created": datetime.now().isoformat()
+            "date_created": self.NOW_ISO
         }
         metadata = TournamentMetadata.from_dict(data)
         self.assertEqual(metadata.name, "Test Tournament")
@@ -118,9 +142,9 @@ class TestTournamentBracket(unittest.TestCase):
         participants = ["A", "B", "C"]
         bracket = TournamentBracket(participants)
         self.assertEqual(bracket.num_participants, 3)
-        # Should have at least one bye
-        bye_count = sum(1 for m in bracket.matches[0] if m.player1 is None or m.player2 is None)
-        self.assertGreater(bye_count, 0)
+        # Should have at least one bye (any() short-circuits on the first)
+        self.assertTrue(any(m.player1 is None or m.player2 is None
+                            for m in bracket.matches[0]))
     
     def test_select_winner_advances(self):
         """Test that selecting a winner advances them to next round."""
@@ -150,20 +174,15 @@ class TestTournamentBracket(unittest.TestCase):
         self.assertEqual(bracket.get_champion(), "A")
     
     def test_reset_bracket(self):
-        """Test bracket state after resetting winners (via GUI)."""
-        # Note: TournamentBracket doesn't have reset(), only GUI has reset_tournament()
-        # This test verifies bracket structure remains intact
+        """Test bracket reset clears all winners."""
         participants = ["A", "B", "C", "D"]
         bracket = TournamentBracket(participants)
-        
+
         # Set some winners
         bracket.set_match_winner(1, 0, bracket.matches[0][0].player1)
-        
-        # Manually clear winners (simulating reset)
-        for round_matches in bracket.matches:
-            for match in round_matches:
-                match.winner = None
-        
+
+        bracket.reset()
+
         # Check all winners cleared
         for round_matches in bracket.matches:
             for match in round_matches:
@@ -183,7 +202,24 @@ class TestTournamentBracket(unittest.TestCase):
         bracket2 = TournamentBracket.from_dict(data)
         self.assertEqual(bracket2.num_participants, 4)
         self.assertEqual(bracket2.matches[0][0].winner, bracket.matches[0][0].winner)
-    
+
+    def test_bracket_legacy_deserialization(self):
+        """Test loading the v1 dict-per-match save format."""
+        data = {
+            "participants": ["A", "B", "C", "D"],
+            "matches": [
+                [{"match_id": 0, "player1": "A", "player2": "B",
+                  "winner": "A", "round_num": 1},
+                 {"match_id": 1, "player1": "C", "player2": "D",
+                  "winner": None, "round_num": 1}],
+                [{"match_id": 2, "player1": "A", "player2": None,
+                  "winner": None, "round_num": 2}],
+            ]
+        }
+        bracket = TournamentBracket.from_dict(data)
+        self.assertEqual(bracket.matches[0][0].winner, "A")
+        self.assertEqual(bracket.matches[1][0].player1, "A")
+
     def test_empty_bracket(self):
         """Test creating bracket with empty participants list."""
         bracket = TournamentBracket([])
@@ -191,19 +227,29 @@ class TestTournamentBracket(unittest.TestCase):
         # Empty bracket still has structure
         self.assertGreaterEqual(bracket.num_rounds, 0)
 
+    def test_bracket_sizing(self):
+        """Test round count and bracket size across power-of-2 boundaries."""
+        expected = {1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 8: 3, 9: 4, 16: 4, 17: 5}
+        for n, rounds in expected.items():
+            with self.subTest(participants=n):
+                bracket = TournamentBracket([f"P{i}" for i in range(n)])
+                self.assertEqual(bracket.num_rounds, rounds)
+                self.assertEqual(bracket.bracket_size, 2 ** rounds)
+
 
 class TestTourSystem(unittest.TestCase):
     """Test the tour system functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one GUI across the class."""
+        cls.gui = TournamentBracketGUI(width=800, height=600)
+
     def setUp(self):
-        """Initialize pygame for GUI tests."""
-        os.environ['SDL_VIDEODRIVER'] = 'dummy'
-        pygame.init()
-    
-    def tearDown(self):
-        """Clean up pygame."""
-        pygame.quit()
-    
+        """Reset tour state on the shared GUI."""
+        self.gui = type(self).gui
+        self.gui.end_tour()
+
     def test_tour_step_creation(self):
         """Test creating tour steps."""
         step = TourStep(
@@ -214,75 +260,70 @@ class TestTourSystem(unittest.TestCase):
             highlight_rect=(100, 100, 200, 200),
             action_required="Click something"
         )
-        self.assertEqual(step.id, "test_step")
-        self.assertEqual(step.title, "Test Step")
-        self.assertEqual(step.tab, "Tournaments")
+        self.assertEqual((step.id, step.title, step.tab),
+                         ("test_step", "Test Step", "Tournaments"))
     
     def test_gui_tour_initialization(self):
         """Test GUI initializes tour steps."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        self.assertIsInstance(gui.tour_steps, list)
+        gui = self.gui
+        self.assertIsInstance(gui.tour_steps, (list, tuple))
         self.assertGreater(len(gui.tour_steps), 0)
         self.assertFalse(gui.tour_active)
         self.assertEqual(gui.tour_step_index, 0)
     
     def test_start_tour(self):
         """Test starting the tour."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.start_tour()
         self.assertTrue(gui.tour_active)
         self.assertEqual(gui.tour_step_index, 0)
         # Should switch to first step's tab
         self.assertEqual(gui.active_tab, gui.tour_steps[0].tab)
     
-    def test_next_tour_step(self):
-        """Test advancing to next tour step."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        gui.start_tour()
-        initial_step = gui.tour_step_index
-        gui.next_tour_step()
-        self.assertEqual(gui.tour_step_index, initial_step + 1)
-    
-    def test_prev_tour_step(self):
-        """Test going back to previous tour step."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        gui.start_tour()
-        gui.next_tour_step()
-        gui.next_tour_step()
-        current_step = gui.tour_step_index
-        gui.prev_tour_step()
-        self.assertEqual(gui.tour_step_index, current_step - 1)
-    
-    def test_prev_tour_step_at_start(self):
-        """Test prev step doesn't go negative."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        gui.start_tour()
-        gui.prev_tour_step()
-        self.assertEqual(gui.tour_step_index, 0)
-    
-    def test_end_tour(self):
-        """Test ending the tour."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        gui.start_tour()
-        gui.next_tour_step()
-        gui.end_tour()
-        self.assertFalse(gui.tour_active)
-        self.assertEqual(gui.tour_step_index, 0)
-    
-    def test_tour_completes_at_last_step(self):
-        """Test advancing past last step ends tour."""
-        gui = TournamentBracketGUI(width=800, height=600)
-        gui.start_tour()
-        # Go to last step
-        while gui.tour_step_index < len(gui.tour_steps) - 1:
+    def test_tour_navigation(self):
+        """Test stepping through the tour in every direction."""
+        gui = self.gui
+
+        with self.subTest(case='next'):
+            gui.start_tour()
+            initial_step = gui.tour_step_index
             gui.next_tour_step()
-        # Advance past last step
-        gui.next_tour_step()
-        self.assertFalse(gui.tour_active)
-    
+            self.assertEqual(gui.tour_step_index, initial_step + 1)
+
+        with self.subTest(case='prev'):
+            gui.end_tour()
+            gui.start_tour()
+            gui.next_tour_step()
+            gui.next_tour_step()
+            current_step = gui.tour_step_index
+            gui.prev_tour_step()
+            self.assertEqual(gui.tour_step_index, current_step - 1)
+
+        with self.subTest(case='prev_at_start'):
+            gui.end_tour()
+            gui.start_tour()
+            gui.prev_tour_step()
+            self.assertEqual(gui.tour_step_index, 0)
+
+        with self.subTest(case='end'):
+            gui.end_tour()
+            gui.start_tour()
+            gui.next_tour_step()
+            gui.end_tour()
+            self.assertFalse(gui.tour_active)
+            self.assertEqual(gui.tour_step_index, 0)
+
+        with self.subTest(case='completes_at_last_step'):
+            gui.start_tour()
+            # Go to last step, then advance past it
+            while gui.tour_step_index < len(gui.tour_steps) - 1:
+                gui.next_tour_step()
+            gui.next_tour_step()
+            self.assertFalse(gui.tour_active)
+
     def test_all_tour_steps_have_required_fields(self):
         """Test all tour steps have required fields."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         for step in gui.tour_steps:
             self.assertIsNotNone(step.id)
             self.assertIsNotNone(step.title)
@@ -295,23 +336,39 @@ class TestTourSystem(unittest.TestCase):
 class TestGUIFeatures(unittest.TestCase):
     """Test GUI features documented in the tour."""
     
-    def setUp(self):
-        """Set up test environment."""
-        os.environ['SDL_VIDEODRIVER'] = 'dummy'
-        pygame.init()
-        self.temp_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-    
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Build one shared GUI saving into a temporary directory."""
+        # RAM-backed temp dir where available: auto-save I/O becomes a memcpy.
+        # The directory is passed to the GUI explicitly — no chdir, so the
+        # classes can run in parallel workers without fighting over the cwd.
+        cls.temp_dir = tempfile.mkdtemp(
+            dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        cls.gui = TournamentBracketGUI(
+            width=800, height=600,
+            tournaments_dir=os.path.join(cls.temp_dir, "tournaments"))
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment."""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.temp_dir)
-        pygame.quit()
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Reset the shared GUI to a clean in-memory state."""
+        self.gui = type(self).gui
+        self.gui.end_tour()
+        self.gui.current_tournament_id = None
+        self.gui.current_metadata = None
+        self.gui.editing_players = []
+        self.gui.initial_participants = []
+        self.gui.bracket = None
+        self.gui.selected_match = None
+        self.gui.active_tab = "Tournaments"
+        self.gui.load_tournaments_list()
     
     def test_create_tournament(self):
         """Test creating a new tournament."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         initial_count = len(gui.tournaments_list)
         gui.create_new_tournament("Test Tourney", "Test Loc", "2026-01-15", "14:00")
         gui.load_tournaments_list()  # Reload list to see new tournament
@@ -321,7 +378,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_load_tournament(self):
         """Test loading a tournament."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test Tourney", "Test Loc", "2026-01-15", "14:00")
         tournament_id = gui.current_tournament_id
         
@@ -334,7 +391,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_edit_tournament_fields(self):
         """Test editing tournament name, location, date, time."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Original", "Original Loc", "2026-01-15", "14:00")
         
         # Simulate editing name
@@ -348,18 +405,17 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_add_players(self):
         """Test adding players to tournament."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         initial_count = len(gui.editing_players)
-        gui.editing_players.append("Player 1")
-        gui.editing_players.append("Player 2")
-        
+        gui.editing_players.extend(("Player 1", "Player 2"))
+
         self.assertEqual(len(gui.editing_players), initial_count + 2)
     
     def test_remove_players(self):
         """Test removing players from tournament."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         gui.editing_players.extend(["Player 1", "Player 2", "Player 3"])
@@ -370,7 +426,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_generate_bracket(self):
         """Test generating bracket from player list."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         gui.editing_players.extend(["A", "B", "C", "D"])
@@ -381,7 +437,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_reset_tournament(self):
         """Test reset clears all winners but keeps players."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         gui.editing_players.extend(["A", "B", "C", "D"])
@@ -400,7 +456,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_reshuffle_tournament(self):
         """Test reshuffle regenerates bracket with same players."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         gui.editing_players.extend(["A", "B", "C", "D"])
@@ -417,25 +473,35 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_auto_save(self):
         """Test that changes are automatically saved."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Auto Save Test", "Loc", "2026-01-15", "14:00")
         tournament_id = gui.current_tournament_id
         
         gui.editing_players.append("Test Player")
         gui.save_current_tournament()
         
-        # Verify file was saved
-        filepath = Path("tournaments") / f"{tournament_id}.json"
-        self.assertTrue(filepath.exists())
-        
-        # Verify data
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        # Verify file was saved (MessagePack when msgspec is installed,
+        # JSON otherwise). Plain string paths: no Path objects needed for
+        # an existence check and a read.
+        if msgspec is not None:
+            filepath = f"{gui.tournaments_dir}/{tournament_id}.mpk"
+            self.assertTrue(os.path.exists(filepath))
+            with open(filepath, 'rb') as f:
+                data = msgspec.msgpack.decode(f.read())
+        else:
+            filepath = f"{gui.tournaments_dir}/{tournament_id}.json"
+            self.assertTrue(os.path.exists(filepath))
+            if orjson is not None:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
         self.assertIn("Test Player", data["participants"])
     
     def test_tab_switching(self):
         """Test switching between tabs."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         
         for tab in gui.tabs:
             gui.active_tab = tab
@@ -443,7 +509,7 @@ class TestGUIFeatures(unittest.TestCase):
     
     def test_scaling_calculation(self):
         """Test UI scales with different participant counts."""
-        gui = TournamentBracketGUI(width=800, height=600)
+        gui = self.gui
         gui.create_new_tournament("Test", "Loc", "2026-01-15", "14:00")
         
         # Small tournament
@@ -463,15 +529,6 @@ class TestGUIFeatures(unittest.TestCase):
 class TestEdgeCAses(unittest.TestCase):
     """Test edge cases and error handling."""
     
-    def setUp(self):
-        """Set up test environment."""
-        os.environ['SDL_VIDEODRIVER'] = 'dummy'
-        pygame.init()
-    
-    def tearDown(self):
-        """Clean up."""
-        pygame.quit()
-    
     def test_bracket_with_one_player(self):
         """Test bracket with only one player."""
         bracket = TournamentBracket(["Solo"])
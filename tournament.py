@@ -1,5 +1,6 @@
 from typing import List, Optional, Tuple, Dict, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+import bisect
 import math
 import pygame
 import sys
@@ -10,6 +11,21 @@ from datetime import datetime
 import uuid
 import random
 
+try:
+    import orjson  # ~10x faster serialize / ~3x parse than stdlib json
+except ImportError:
+    orjson = None  # Stdlib json handles persistence instead
+
+try:
+    import msgspec  # MessagePack: much faster and smaller on disk than JSON
+except ImportError:
+    msgspec = None  # Tournaments stay in JSON
+
+try:
+    import numpy as np  # C-level shuffling for large player lists
+except ImportError:
+    np = None  # random.shuffle covers it
+
 
 # Modern 2026 Color Palette
 WHITE = (255, 255, 255)
@@ -52,8 +68,97 @@ BUTTON_HOVER = PRIMARY_HOVER
 GLASS_BG = (255, 255, 255, 230)  # Semi-transparent white
 GLASS_DARK = (40, 44, 52, 200)   # Semi-transparent dark
 
+# Player-slot display states with their color lookup tables
+_SLOT_BYE, _SLOT_PENDING, _SLOT_HOVERED, _SLOT_WINNER, _SLOT_LOSER = range(5)
+_SLOT_BG_COLORS = (OFF_WHITE, OFF_WHITE, PRIMARY_LIGHT, ACCENT_GREEN, OFF_WHITE)
+_SLOT_TEXT_COLORS = (CHARCOAL, CHARCOAL, PRIMARY_DARK, WHITE, MED_GRAY)
+
+# Tour highlight border colors for one PRIMARY->white pulse, indexed by
+# quantized time: replaces per-frame math.sin plus three float blends
+_PULSE_COLORS = tuple(
+    (PRIMARY[0] + round((255 - PRIMARY[0]) * math.sin(math.pi * i / 256)),
+     PRIMARY[1] + round((255 - PRIMARY[1]) * math.sin(math.pi * i / 256)),
+     PRIMARY[2] + round((255 - PRIMARY[2]) * math.sin(math.pi * i / 256)))
+    for i in range(256)
+)
+
+
+def _is_text_key(ch: str) -> bool:
+    """Printable check for keystroke text entry.
+
+    str.isprintable walks the Unicode tables on every KEYDOWN; a bounds
+    check covering ASCII printables plus everything past the Latin-1
+    control block is enough for the text these fields accept.
+    """
+    return bool(ch) and (32 <= ord(ch[0]) < 127 or ord(ch[0]) >= 160)
+
+
+def _write_bytes_atomic(filepath, payload: bytes):
+    """Write via a sibling temp file and os.replace.
+
+    Saves happen on every recorded result; writing the final path directly
+    would leave a truncated file behind if the process dies mid-write.
+    os.replace is atomic on the same filesystem, so readers see either the
+    old file or the new one, never a partial.
+    """
+    filepath = Path(filepath)
+    tmp = filepath.with_name(filepath.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, filepath)
+
+
+def write_json_file(filepath, data: dict):
+    """Write a dict to disk as indented JSON (orjson when available)."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    _write_bytes_atomic(filepath, payload)
+
+
+def read_json_file(filepath) -> dict:
+    """Read a JSON file into a dict (orjson when available)."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+if msgspec is not None:
+    # Shared encoder/decoder: construction is the expensive part of msgspec
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
 
-@dataclass
+
+def write_tournament_file(tournaments_dir: Path, tournament_id: str, data: dict):
+    """Persist one tournament: MessagePack (.mpk) when msgspec is installed,
+    JSON otherwise."""
+    if msgspec is not None:
+        filepath = tournaments_dir / f"{tournament_id}.mpk"
+        _write_bytes_atomic(filepath, _MSGPACK_ENCODER.encode(data))
+    else:
+        write_json_file(tournaments_dir / f"{tournament_id}.json", data)
+
+
+def read_tournament_file(filepath: Path) -> dict:
+    """Read a stored tournament in either format."""
+    if filepath.suffix == ".mpk":
+        return _MSGPACK_DECODER.decode(filepath.read_bytes())
+    return read_json_file(filepath)
+
+
+def find_tournament_file(tournaments_dir: Path, tournament_id: str) -> Optional[Path]:
+    """Locate a stored tournament, preferring MessagePack over legacy JSON."""
+    suffixes = (".mpk", ".json") if msgspec is not None else (".json",)
+    for suffix in suffixes:
+        filepath = tournaments_dir / f"{tournament_id}{suffix}"
+        if filepath.exists():
+            return filepath
+    return None
+
+
+@dataclass(slots=True)
 class TourStep:
     """Represents a single step in the user tour."""
     id: str
@@ -65,7 +170,127 @@ class TourStep:
     validation: Optional[Callable[[], bool]] = None  # Check if step is complete
 
 
-@dataclass
+# One tour-step tuple per window geometry, built on first use and shared by
+# every GUI instance with that geometry: the steps are immutable config.
+_TOUR_STEPS_CACHE: Dict[Tuple[int, int, int], Tuple[TourStep, ...]] = {}
+
+
+def build_tour_steps(width: int, height: int, tab_height: int) -> Tuple[TourStep, ...]:
+    """Return the (cached) tour steps for a given window geometry."""
+    key = (width, height, tab_height)
+    steps = _TOUR_STEPS_CACHE.get(key)
+    if steps is None:
+        steps = (
+            TourStep(
+                id="welcome",
+                title="Welcome to Tournament Manager!",
+                description="This tour will walk you through all the features. Press T to start the tour anytime, or ESC to skip.",
+                tab="Tournaments",
+                highlight_rect=None,
+                action_required="Click 'Next' to continue"
+            ),
+            TourStep(
+                id="create_tournament",
+                title="Creating Tournaments",
+                description="Click the 'Create New Tournament' button to create a tournament. Each tournament has a name, location, and scheduled date/time.",
+                tab="Tournaments",
+                highlight_rect=(width // 2 - 120, height - 80, 240, 50),
+                action_required="Create a tournament to continue"
+            ),
+            TourStep(
+                id="tournament_list",
+                title="Tournament List",
+                description="All your tournaments are listed here. Click any tournament to view and edit it.",
+                tab="Tournaments",
+                highlight_rect=(100, tab_height + 120, width - 200, 300),
+                action_required="Select a tournament to continue"
+            ),
+            TourStep(
+                id="edit_tournament_info",
+                title="Editable Tournament Details",
+                description="You can edit the tournament name, location, date, and time by clicking on them. Notice the edit icons (✎) indicating editable fields.",
+                tab="Current Tournament",
+                highlight_rect=(100, tab_height + 80, 800, 180),
+                action_required="Try editing a field (optional)"
+            ),
+            TourStep(
+                id="add_players",
+                title="Managing Players",
+                description="Add players to your tournament here. Type a name and press Enter or click 'Add Player'. You can also remove players with the X button.",
+                tab="Player List",
+                highlight_rect=(width // 2 - 250, tab_height + 120, 500, 400),
+                action_required="Add at least 2 players to continue"
+            ),
+            TourStep(
+                id="generate_bracket",
+                title="Generate Bracket",
+                description="Once you have at least 2 players, click 'Generate Bracket' to create the tournament structure. Byes are automatically assigned if needed.",
+                tab="Player List",
+                highlight_rect=(width // 2 - 120, height - 60, 240, 50),
+                action_required="Generate the bracket"
+            ),
+            TourStep(
+                id="view_bracket",
+                title="Tournament Bracket",
+                description="Here's your tournament bracket! Click on a match to select it, then click a player's name to declare them the winner. Winners advance automatically.",
+                tab="Bracket",
+                highlight_rect=(50, tab_height + 120, width - 100, 400),
+                action_required="Select a match and choose a winner"
+            ),
+            TourStep(
+                id="match_selection",
+                title="Match Interaction",
+                description="Selected matches are highlighted with a blue glow. Only matches with both players can have winners declared. Winners get green checkmarks.",
+                tab="Bracket",
+                highlight_rect=None,
+                action_required="Try selecting different matches"
+            ),
+            TourStep(
+                id="final_results",
+                title="Final Results",
+                description="Once the tournament is complete, view the final standings here. The champion is highlighted in gold!",
+                tab="Final Results",
+                highlight_rect=(width // 2 - 150, tab_height + 80, 300, 500),
+                action_required=None
+            ),
+            TourStep(
+                id="dangerous_operations",
+                title="Dangerous Operations",
+                description="The 'Dangerous Operations' panel on the Current Tournament tab lets you reset (clear all winners) or reshuffle (regenerate with same players).",
+                tab="Current Tournament",
+                highlight_rect=(100, tab_height + 450, width - 200, 150),
+                action_required=None
+            ),
+            TourStep(
+                id="auto_save",
+                title="Automatic Saving",
+                description="All changes are automatically saved! Your tournaments, players, and match results persist between sessions.",
+                tab="Current Tournament",
+                highlight_rect=None,
+                action_required=None
+            ),
+            TourStep(
+                id="keyboard_shortcuts",
+                title="Keyboard Shortcuts",
+                description="Press H on the Bracket tab to toggle instructions. Press T anytime to restart this tour. Press ESC to cancel editing or close dialogs.",
+                tab="Bracket",
+                highlight_rect=None,
+                action_required=None
+            ),
+            TourStep(
+                id="tour_complete",
+                title="Tour Complete!",
+                description="You've learned all the features! Press T anytime to replay this tour. Happy bracketing!",
+                tab="Tournaments",
+                highlight_rect=None,
+                action_required="Click 'Finish' to end tour"
+            )
+        )
+        _TOUR_STEPS_CACHE[key] = steps
+    return steps
+
+
+@dataclass(slots=True)
 class TournamentMetadata:
     """Metadata for a tournament."""
     id: str
@@ -76,14 +301,22 @@ class TournamentMetadata:
     date_created: str  # ISO format with time
     
     def to_dict(self) -> dict:
-        return asdict(self)
-    
+        # Explicit fields: asdict() goes through deepcopy machinery
+        return {
+            "id": self.id,
+            "name": self.name,
+            "location": self.location,
+            "date_scheduled": self.date_scheduled,
+            "time_scheduled": self.time_scheduled,
+            "date_created": self.date_created,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> 'TournamentMetadata':
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a single match in the tournament."""
     match_id: int
@@ -94,7 +327,7 @@ class Match:
     
     def set_winner(self, winner: str):
         """Set the winner of the match."""
-        if winner not in [self.player1, self.player2]:
+        if winner != self.player1 and winner != self.player2:
             raise ValueError(f"{winner} is not a participant in this match")
         self.winner = winner
     
@@ -107,7 +340,9 @@ class TournamentBracket:
     """Single elimination tournament bracket."""
     
     def __init__(self, participants: List[str]):
-        self.participants = participants
+        # Immutable participant table; matches reference these exact string
+        # objects rather than copies
+        self.participants = tuple(participants)
         self.num_participants = len(participants)
         
         # Handle empty or single participant
@@ -115,72 +350,117 @@ class TournamentBracket:
             self.num_rounds = 1
             self.bracket_size = 2
         else:
-            self.num_rounds = math.ceil(math.log2(self.num_participants))
-            self.bracket_size = 2 ** self.num_rounds
+            # ceil(log2(n)) without float math: one bit_length call
+            self.num_rounds = (self.num_participants - 1).bit_length()
+            self.bracket_size = 1 << self.num_rounds
         
         self.seeded_participants = self._seed_participants()
-        self.matches: List[List[Match]] = self._initialize_matches()
-    
+        # Matches live in one flat pre-sized list; the per-round nested
+        # view slices it, sharing the same objects, and _round_offsets maps
+        # match (r, i) to _all_matches[off[r-1]+i]
+        self._all_matches: List[Match] = self._initialize_matches()
+        self._round_offsets: List[int] = []
+        self.matches: List[List[Match]] = []
+        offset = 0
+        for round_num in range(1, self.num_rounds + 1):
+            count = self.bracket_size >> round_num
+            self._round_offsets.append(offset)
+            self.matches.append(self._all_matches[offset:offset + count])
+            offset += count
+        # Display names are fixed once num_rounds is known
+        self.round_names: List[str] = [
+            self._get_round_name(r) for r in range(1, self.num_rounds + 1)
+        ]
+
     def _seed_participants(self) -> List[Optional[str]]:
-        seeded = self.participants.copy()
+        # Pad with byes in one list op instead of an append loop
         num_byes = self.bracket_size - self.num_participants
-        for _ in range(num_byes):
-            seeded.append(None)
-        return seeded
+        return list(self.participants) + [None] * num_byes
     
-    def _initialize_matches(self) -> List[List[Match]]:
-        matches = []
+    def _initialize_matches(self) -> List[Match]:
+        """Build every match in one pre-sized flat pass.
+
+        A full single-elimination bracket has bracket_size - 1 matches;
+        allocating the list up front and constructing with positional args
+        skips both list growth and per-call kwargs dicts.
+        """
+        seeded = self.seeded_participants
+        flat: List[Match] = [None] * (self.bracket_size - 1)
         match_id = 0
-        
-        # First round
-        first_round = []
+
+        # First round, with automatic bye wins
         for i in range(0, self.bracket_size, 2):
-            match = Match(
-                match_id=match_id,
-                player1=self.seeded_participants[i],
-                player2=self.seeded_participants[i + 1],
-                round_num=1
-            )
-            if match.player1 and not match.player2:
-                match.winner = match.player1
-            elif match.player2 and not match.player1:
-                match.winner = match.player2
-            
-            first_round.append(match)
+            p1 = seeded[i]
+            p2 = seeded[i + 1]
+            winner = p1 if (p1 and not p2) else p2 if (p2 and not p1) else None
+            flat[match_id] = Match(match_id, p1, p2, winner, 1)
             match_id += 1
-        
-        matches.append(first_round)
-        
-        # Subsequent rounds
+
+        # Subsequent rounds start empty
         for round_num in range(2, self.num_rounds + 1):
-            round_matches = []
-            num_matches = self.bracket_size // (2 ** round_num)
-            
-            for _ in range(num_matches):
-                match = Match(match_id=match_id, round_num=round_num)
-                round_matches.append(match)
+            for _ in range(self.bracket_size >> round_num):
+                flat[match_id] = Match(match_id, None, None, None, round_num)
                 match_id += 1
-            
-            matches.append(round_matches)
-        
-        return matches
+
+        return flat
     
-    def set_match_winner(self, round_num: int, match_index: int, winner: str):
+    def set_match_winner(self, round_num: int, match_index: int, winner: str) -> bool:
+        """Record a winner and propagate them to the next round.
+
+        Returns True if anything changed, False for an idempotent re-click
+        of the current winner (so callers can skip cache invalidation and
+        saving).
+        """
         if round_num < 1 or round_num > self.num_rounds:
             raise ValueError(f"Invalid round number: {round_num}")
-        
-        match = self.matches[round_num - 1][match_index]
+
+        # Flat contiguous indexing: one list lookup per match instead of
+        # chasing the nested per-round lists
+        match = self._all_matches[self._round_offsets[round_num - 1] + match_index]
+        if match.winner == winner:
+            return False
         match.set_winner(winner)
-        
+
         if round_num < self.num_rounds:
-            next_match_index = match_index // 2
-            next_match = self.matches[round_num][next_match_index]
-            
+            next_match = self._all_matches[
+                self._round_offsets[round_num] + match_index // 2]
+
             if match_index % 2 == 0:
                 next_match.player1 = winner
             else:
                 next_match.player2 = winner
+        return True
     
+    def reset(self):
+        """Clear every match winner in one flat sweep."""
+        for match in self._all_matches:
+            match.winner = None
+
+    def reseed(self, participants: List[str]):
+        """Re-seed the existing bracket structure in place.
+
+        Reuses the allocated Match objects instead of rebuilding: reassigns
+        the first-round pairings from the new order, clears later-round
+        slots and winners, and re-applies automatic bye wins. Only valid
+        when the participant count is unchanged.
+        """
+        self.participants = tuple(participants)
+        self.seeded_participants = self._seed_participants()
+        for i, match in enumerate(self.matches[0]):
+            match.player1 = self.seeded_participants[2 * i]
+            match.player2 = self.seeded_participants[2 * i + 1]
+            if match.player1 and not match.player2:
+                match.winner = match.player1
+            elif match.player2 and not match.player1:
+                match.winner = match.player2
+            else:
+                match.winner = None
+        for round_matches in self.matches[1:]:
+            for match in round_matches:
+                match.player1 = None
+                match.player2 = None
+                match.winner = None
+
     def get_champion(self) -> Optional[str]:
         if self.num_rounds > 0:
             final_match = self.matches[-1][0]
@@ -201,40 +481,62 @@ class TournamentBracket:
     
     def to_dict(self) -> dict:
         """Convert tournament state to dictionary for JSON serialization."""
+        # Positional v2 schema: field names would repeat per match and
+        # dominate the payload on large brackets. match_id/round_num are
+        # derivable from position, so only the mutable fields are stored.
         return {
             "participants": self.participants,
+            "v": 2,
             "matches": [
-                [asdict(match) for match in round_matches]
+                [[m.player1, m.player2, m.winner] for m in round_matches]
                 for round_matches in self.matches
             ]
         }
-    
+
     @classmethod
     def from_dict(cls, data: dict) -> 'TournamentBracket':
         """Restore tournament state from dictionary."""
         bracket = cls(data["participants"])
-        
-        # Restore match states
+
+        # Restore match states; v1 files used a dict per match
+        v2 = data.get("v", 1) >= 2
         for round_idx, round_matches_data in enumerate(data["matches"]):
             for match_idx, match_data in enumerate(round_matches_data):
                 match = bracket.matches[round_idx][match_idx]
-                match.player1 = match_data["player1"]
-                match.player2 = match_data["player2"]
-                match.winner = match_data["winner"]
-        
+                if v2:
+                    match.player1, match.player2, match.winner = match_data
+                else:
+                    match.player1 = match_data["player1"]
+                    match.player2 = match_data["player2"]
+                    match.winner = match_data["winner"]
+
         return bracket
 
 
 class TournamentBracketGUI:
     """Interactive pygame GUI for tournament brackets."""
-    
-    def __init__(self, width: int = 1400, height: int = 800):
-        pygame.init()
-        
+
+    # Scaling tiers by participant count: (max participants or None,
+    # (title, round, player, small, button) font sizes, (match w, match h))
+    SIZE_TIERS = (
+        (8, (52, 34, 26, 22, 30), (220, 90)),
+        (16, (46, 30, 22, 20, 26), (200, 80)),
+        (32, (40, 26, 20, 18, 24), (180, 70)),
+        (None, (36, 22, 18, 16, 22), (160, 60)),
+    )
+
+    def __init__(self, width: int = 1400, height: int = 800, flags: int = 0,
+                 tournaments_dir: str = "tournaments"):
+        # Only the subsystems this GUI uses: skipping pygame.init() avoids
+        # probing and tearing down the audio/mixer stack entirely
+        pygame.display.init()
+        pygame.font.init()
+
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))
+        self.screen = pygame.display.set_mode((width, height), flags)
         pygame.display.set_caption("Tournament Manager")
+        self._gradient_bg = self._build_background()
         
         # Tab system
         self.tabs = ["Tournaments", "Current Tournament", "Player List", "Bracket", "Final Results"]
@@ -242,17 +544,44 @@ class TournamentBracketGUI:
         self.tab_height = 50
         
         # Multi-tournament system
-        self.tournaments_dir = Path("tournaments")
+        self.tournaments_dir = Path(tournaments_dir)
         self.tournaments_dir.mkdir(exist_ok=True)
         self.current_tournament_id: Optional[str] = None
         self.current_metadata: Optional[TournamentMetadata] = None
         
         # Initialize with empty tournament
         self.bracket: Optional[TournamentBracket] = None
-        self.initial_participants: List[str] = []
+        self.initial_participants: Tuple[str, ...] = ()
         self.editing_players: List[str] = []
         
         # Recalculate scaling
+        self._font_cache: Dict[int, pygame.font.Font] = {}
+        # Rendered text keyed by (font, text, color): TTF rasterization is the
+        # dominant per-frame cost, and almost every string repeats frame to
+        # frame. Fonts live forever in _font_cache, so id(font) keys are stable.
+        self._text_cache: Dict[Tuple[int, str, tuple], pygame.Surface] = {}
+        # Word-wrapped tour descriptions keyed by (font, text, max width)
+        self._wrap_cache: Dict[Tuple[int, str, int], List[str]] = {}
+        # Full-screen dialog darkening layers keyed by (alpha, fill color)
+        self._dark_overlays: Dict[Tuple[int, tuple], pygame.Surface] = {}
+        # Composited bracket layer: all match cards rendered once into a
+        # surface and blitted per frame until a result changes (_bg_dirty).
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._bg_dirty = True
+        # Results-tab aggregates, recomputed only when a result changes
+        # (invalidated alongside _bg_dirty)
+        self._match_stats: Optional[Tuple[int, int]] = None
+        self._placements: Optional[Tuple[Optional[str], List[str]]] = None
+        # Card chrome templates keyed by (width, height, selected)
+        self._box_template_cache: Dict[Tuple[int, int, bool], pygame.Surface] = {}
+        # Baked plain buttons (fill, border, label) keyed by (text, size, color)
+        self._button_cache: Dict[Tuple[str, int, int, tuple], pygame.Surface] = {}
+        # Selection-prompt backdrop keyed by size (varies with the names shown)
+        self._prompt_bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Scratch rect for _match_at hit-testing (repositioned per event)
+        self._probe_rect = pygame.Rect(0, 0, 1, 1)
+        # Translucent rounded rects (shadows/glows) keyed by size+color+radius
+        self._alpha_rect_cache: Dict[Tuple[int, int, tuple, int], pygame.Surface] = {}
         self._recalculate_scaling()
         
         self.selected_match: Optional[Tuple[int, int]] = None
@@ -260,6 +589,7 @@ class TournamentBracketGUI:
         
         self.scroll_offset = 0
         self.show_instructions = True
+        self._needs_redraw = True
         
         # UI state
         self.dangerous_panel_open = False
@@ -284,58 +614,257 @@ class TournamentBracketGUI:
         
         # Buttons
         self.close_button_rect = pygame.Rect(self.width - 50, 10, 30, 30)
-        
+        self._compute_static_rects()
+
+        # Per-tab click dispatch; tabs without interactions (Final Results)
+        # simply have no entry
+        self._tab_click_handlers = {
+            "Current Tournament": self._click_current_tab,
+            "Player List": self._click_player_list_tab,
+            "Tournaments": self._click_tournaments_tab,
+            "Bracket": self._click_bracket_tab,
+        }
+
         self.clock = pygame.time.Clock()
+
+        # Save debouncing: mutations mark the state dirty and the main loop
+        # flushes at most one write per interval, so bursts (typing a name,
+        # rapid clicks) collapse into a single disk write
+        self._save_pending = False
+        self._last_save_ticks = 0
         
         # Load tournament list
         self.load_tournaments_list()
     
+    def _compute_static_rects(self):
+        """Build the fixed widget rects shared by drawing and hit-testing.
+
+        The window is not resizable, so everything positioned off
+        width/height/tab_height is constant; allocating these Rects once
+        removes the per-event (and per-frame, for the tour) constructor
+        churn and keeps both sides reading the same geometry.
+        """
+        w, h, th = self.width, self.height, self.tab_height
+
+        # Close-confirmation dialog
+        self._dialog_yes_rect = pygame.Rect(w // 2 - 120, h // 2 + 20, 100, 40)
+        self._dialog_no_rect = pygame.Rect(w // 2 + 20, h // 2 + 20, 100, 40)
+
+        # Current Tournament editable fields and dangerous panel
+        self._edit_name_rect = pygame.Rect(300, th + 72, 500, 40)
+        self._edit_location_rect = pygame.Rect(300, th + 132, 500, 40)
+        self._edit_date_rect = pygame.Rect(300, th + 192, 250, 40)
+        self._edit_time_rect = pygame.Rect(570, th + 192, 230, 40)
+        self._panel_toggle_rect = pygame.Rect(100, th + 450, w - 200, 40)
+        self._reset_btn_rect = pygame.Rect(w // 2 - 220, th + 520, 200, 50)
+        self._reshuffle_btn_rect = pygame.Rect(w // 2 + 20, th + 520, 200, 50)
+
+        # Player List / Tournaments buttons
+        self._add_player_rect = pygame.Rect(w // 2 - 100, h - 120, 200, 50)
+        self._generate_rect = pygame.Rect(w // 2 - 120, h - 60, 240, 50)
+        self._create_tournament_rect = pygame.Rect(w // 2 - 120, h - 80, 240, 50)
+
+        # Tour panel and its buttons
+        panel_height = 220
+        panel = pygame.Rect(50, h - panel_height - 20, w - 100, panel_height)
+        button_y = panel.y + panel_height - 60
+        self._tour_panel_rect = panel
+        self._tour_prev_rect = pygame.Rect(panel.x + 20, button_y, 100, 40)
+        self._tour_next_rect = pygame.Rect(panel.x + 140, button_y, 100, 40)
+        self._tour_skip_rect = pygame.Rect(panel.right - 120, button_y, 100, 40)
+
     def _recalculate_scaling(self):
         """Recalculate UI scaling based on current participant count."""
         self.num_participants = len(self.editing_players)
         self.num_rounds = self.bracket.num_rounds if self.bracket else 1
-        
+
         # Scale fonts based on participant count - larger for better readability
-        if self.num_participants <= 8:
-            title_size, round_size, player_size, small_size, button_size = 52, 34, 26, 22, 30
-            self.match_width, self.match_height = 220, 90
-        elif self.num_participants <= 16:
-            title_size, round_size, player_size, small_size, button_size = 46, 30, 22, 20, 26
-            self.match_width, self.match_height = 200, 80
-        elif self.num_participants <= 32:
-            title_size, round_size, player_size, small_size, button_size = 40, 26, 20, 18, 24
-            self.match_width, self.match_height = 180, 70
-        else:
-            title_size, round_size, player_size, small_size, button_size = 36, 22, 18, 16, 22
-            self.match_width, self.match_height = 160, 60
-        
-        self.title_font = pygame.font.Font(None, title_size)
-        self.round_font = pygame.font.Font(None, round_size)
-        self.player_font = pygame.font.Font(None, player_size)
-        self.small_font = pygame.font.Font(None, small_size)
-        self.button_font = pygame.font.Font(None, button_size)
-        
+        for limit, font_sizes, match_size in self.SIZE_TIERS:
+            if limit is None or self.num_participants <= limit:
+                break
+        self.match_width, self.match_height = match_size
+        (self.title_font, self.round_font, self.player_font,
+         self.small_font, self.button_font) = map(self._get_font, font_sizes)
+
         self.player_height = self.match_height // 2 - 5
-    
+        self._compute_layout()
+        self._bg_dirty = True
+        self._match_stats = None
+        self._placements = None
+        self._instructions_surface = None
+
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Font objects cached per size; Font(None, n) re-parses the TTF
+        every call. The cache is per instance (not module level) because
+        Font objects die with pygame.quit()."""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = self._font_cache[size] = pygame.font.Font(None, size)
+        return font
+
+    def _compute_layout(self):
+        """Precompute per-round bracket geometry (scroll-independent).
+
+        _draw_rounds, _draw_connections and the mouse handlers all need the
+        same x/y math; computing it once per layout change turns those hot
+        paths into table lookups instead of repeated float divisions.
+        """
+        self._round_x: List[float] = []
+        self._match_spacing: List[float] = []
+        self._match_pos: List[List[Tuple[float, float]]] = []
+        self._match_rects: List[List[pygame.Rect]] = []
+        self._player_rects: List[List[Tuple[pygame.Rect, pygame.Rect]]] = []
+        self._connection_segments: List[Tuple[Tuple[float, float],
+                                              Tuple[float, float]]] = []
+        if not self.bracket:
+            return
+
+        round_spacing = (self.width - 100) / self.bracket.num_rounds
+        start_y = self.tab_height + 120
+        for round_num, round_matches in enumerate(self.bracket.matches, 1):
+            x = 50 + round_num * round_spacing - round_spacing / 2
+            spacing = self._get_match_spacing(len(round_matches))
+            self._round_x.append(x)
+            self._match_spacing.append(spacing)
+            self._match_pos.append([(x, start_y + 50 + i * spacing)
+                                    for i in range(len(round_matches))])
+            self._match_rects.append([
+                pygame.Rect(x - self.match_width // 2, y,
+                            self.match_width, self.match_height)
+                for _, y in self._match_pos[-1]
+            ])
+            self._player_rects.append([
+                (pygame.Rect(box.x, box.y, box.width, self.player_height),
+                 pygame.Rect(box.x, box.y + self.player_height,
+                             box.width, self.player_height))
+                for box in self._match_rects[-1]
+            ])
+
+        # Connection lines between consecutive rounds, scroll-independent
+        half_height = self.match_height // 2
+        for round_num in range(1, self.bracket.num_rounds):
+            current_pos = self._match_pos[round_num - 1]
+            next_pos = self._match_pos[round_num]
+            current_x = self._round_x[round_num - 1] + self.match_width // 2
+            next_x = self._round_x[round_num] - self.match_width // 2
+            for idx in range(len(next_pos)):
+                next_y = next_pos[idx][1] + half_height
+                for child_idx in (idx * 2, idx * 2 + 1):
+                    if child_idx < len(current_pos):
+                        child_y = current_pos[child_idx][1] + half_height
+                        self._connection_segments.append(
+                            ((current_x, child_y), (next_x, next_y)))
+
+    def _match_at(self, mx: int, my: int) -> Optional[Tuple[int, int]]:
+        """Hit-test a screen point against the bracket, as (round_num, idx).
+
+        The rect tables are scroll-independent; the query point is
+        translated instead, so scrolling never forces a rebuild. bisect on
+        _round_x narrows the candidates to the two adjacent columns, and
+        collidelist scans each column's rects in C.
+        """
+        # Shared 1x1 probe: this runs on every MOUSEMOTION, so skip the
+        # Rect construction and just reposition it
+        point_rect = self._probe_rect
+        point_rect.x = mx
+        point_rect.y = my - self.scroll_offset
+        col = bisect.bisect_left(self._round_x, mx)
+        for r in (col - 1, col):
+            if 0 <= r < len(self._match_rects):
+                idx = point_rect.collidelist(self._match_rects[r])
+                if idx != -1:
+                    return (r + 1, idx)
+        return None
+
+    def _render_text(self, font, text, antialias, color) -> pygame.Surface:
+        """Font.render with memoization per (font, text, color).
+
+        Identical text is re-rendered every frame all over the draw path;
+        serving repeats from the cache skips the TTF rasterization entirely.
+        """
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # convert_alpha puts the glyph surface in the display format so
+            # every later blit is a fast-path copy instead of a per-pixel
+            # format conversion.
+            surf = font.render(text, antialias, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
+    def _get_box_template(self, is_selected: bool) -> pygame.Surface:
+        """Pre-rendered match-card chrome (shadow, glow, fill, border).
+
+        Rounded-rect rasterization is paid once per card size and
+        selection state; _draw_match blits the template instead of
+        re-rasterizing five rounded rects per card.
+        """
+        key = (self.match_width, self.match_height, is_selected)
+        template = self._box_template_cache.get(key)
+        if template is None:
+            margin = 6
+            w, h = self.match_width, self.match_height
+            template = pygame.Surface((w + 2 * margin, h + 2 * margin), pygame.SRCALPHA)
+            box = pygame.Rect(margin, margin, w, h)
+
+            # Modern shadow with blur simulation
+            for i in range(3):
+                shadow = pygame.Surface((w, h), pygame.SRCALPHA)
+                pygame.draw.rect(shadow, (0, 0, 0, 15 - i * 5),
+                                 shadow.get_rect(), border_radius=10)
+                template.blit(shadow, box.move(2 + i, 3 + i))
+
+            # Glassmorphic fill, selection glow, border
+            pygame.draw.rect(template, OFF_WHITE, box, border_radius=10)
+            if is_selected:
+                pygame.draw.rect(template, (*ACCENT_ORANGE, 40),
+                                 template.get_rect(), border_radius=12)
+            border_color = ACCENT_ORANGE if is_selected else PRIMARY
+            border_width = 3 if is_selected else 2
+            pygame.draw.rect(template, border_color, box, border_width, border_radius=10)
+
+            template = template.convert_alpha()
+            self._box_template_cache[key] = template
+        return template
+
+    def _get_alpha_rect(self, width: int, height: int, color: tuple,
+                        radius: int) -> pygame.Surface:
+        """Cached translucent rounded rect for shadows and glow halos.
+
+        These used to be allocated and rasterized fresh on every draw;
+        widget sizes and colors repeat, so a small FIFO-bounded cache
+        turns each into a single blit.
+        """
+        key = (width, height, color, radius)
+        surf = self._alpha_rect_cache.get(key)
+        if surf is None:
+            if len(self._alpha_rect_cache) >= 64:
+                self._alpha_rect_cache.pop(next(iter(self._alpha_rect_cache)))
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+            surf = surf.convert_alpha()
+            self._alpha_rect_cache[key] = surf
+        return surf
+
     def _draw_card(self, rect: pygame.Rect, color=None, border_color=None, shadow=True, glow=False):
         """Draw a modern card with glassmorphism effect."""
         if color is None:
             color = OFF_WHITE
         if border_color is None:
             border_color = MED_GRAY
-        
+
         # Shadow for depth
         if shadow:
-            shadow_surf = pygame.Surface((rect.width + 4, rect.height + 4), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surf, (0, 0, 0, 20), shadow_surf.get_rect(), border_radius=12)
+            shadow_surf = self._get_alpha_rect(rect.width + 4, rect.height + 4,
+                                               (0, 0, 0, 20), 12)
             self.screen.blit(shadow_surf, (rect.x + 2, rect.y + 4))
-        
+
         # Glow effect (for hover states)
         if glow and border_color:
-            glow_surf = pygame.Surface((rect.width + 12, rect.height + 12), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*border_color, 50), glow_surf.get_rect(), border_radius=14)
+            glow_surf = self._get_alpha_rect(rect.width + 12, rect.height + 12,
+                                             (*border_color, 50), 14)
             self.screen.blit(glow_surf, (rect.x - 6, rect.y - 6))
-        
+
         # Main card
         pygame.draw.rect(self.screen, color, rect, border_radius=10)
         pygame.draw.rect(self.screen, border_color, rect, 2, border_radius=10)
@@ -357,24 +886,44 @@ class TournamentBracketGUI:
         if hover and not disabled:
             draw_rect.inflate_ip(4, 2)
             # Glow
-            glow = pygame.Surface((draw_rect.width + 8, draw_rect.height + 8), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (*bg_color, 60), glow.get_rect(), border_radius=10)
+            glow = self._get_alpha_rect(draw_rect.width + 8, draw_rect.height + 8,
+                                        (*bg_color, 60), 10)
             self.screen.blit(glow, (draw_rect.x - 4, draw_rect.y - 4))
-        
+
         # Shadow
         if not disabled:
-            shadow = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0, 0, 0, 30), shadow.get_rect(), border_radius=8)
+            shadow = self._get_alpha_rect(draw_rect.width, draw_rect.height,
+                                          (0, 0, 0, 30), 8)
             self.screen.blit(shadow, (draw_rect.x + 2, draw_rect.y + 3))
         
         # Button
         pygame.draw.rect(self.screen, bg_color, draw_rect, border_radius=8)
         
         # Text
-        text_surf = self.button_font.render(text, True, text_color)
+        text_surf = self._render_text(self.button_font, text, True, text_color)
         text_rect = text_surf.get_rect(center=draw_rect.center)
         self.screen.blit(text_surf, text_rect)
     
+    def _get_button_surface(self, text: str, width: int, height: int, color) -> pygame.Surface:
+        """Bake a plain rectangular button (fill, border, centered label).
+
+        The fixed-size buttons redraw identically every frame; compositing
+        each state once turns two rounded-rect draws plus a text blit into a
+        single cached blit.
+        """
+        key = (text, width, height, color)
+        surf = self._button_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            rect = surf.get_rect()
+            pygame.draw.rect(surf, color, rect, border_radius=5)
+            pygame.draw.rect(surf, DARK_GRAY, rect, 2, border_radius=5)
+            label = self._render_text(self.button_font, text, True, WHITE)
+            surf.blit(label, label.get_rect(center=rect.center))
+            surf = surf.convert_alpha()
+            self._button_cache[key] = surf
+        return surf
+
     def _get_match_spacing(self, num_matches: int) -> float:
         """Calculate match spacing ensuring no overlap."""
         available_height = self.height - self.tab_height - 120 - 150
@@ -388,13 +937,24 @@ class TournamentBracketGUI:
     
     def run(self):
         running = True
-        
+        self._needs_redraw = True
+
         while running:
-            for event in pygame.event.get():
+            # Event-driven rendering: sleep in wait() until input arrives.
+            # Animated UI (tour pulse, blinking text cursor) still needs
+            # periodic frames, so use a short timeout while it is showing.
+            animating = self.tour_active or self.active_input_field is not None
+            first = pygame.event.wait(16 if animating else 250)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+
+            for event in events:
                 if event.type == pygame.QUIT:
-                    self.save_current_tournament()
+                    self._queue_save()
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self._needs_redraw = True
                     if event.button == 1:
                         # Check tour overlay clicks first
                         if self._handle_tour_click(event.pos):
@@ -412,8 +972,14 @@ class TournamentBracketGUI:
                     elif event.button == 5:
                         self.scroll_offset -= 30
                 elif event.type == pygame.MOUSEMOTION:
+                    # Motion is the chattiest event; only repaint when the
+                    # hover state it drives actually changed.
+                    old_hover = (self.hovered_player, self.hovered_close_button)
                     self._handle_hover(event.pos)
+                    if (self.hovered_player, self.hovered_close_button) != old_hover:
+                        self._needs_redraw = True
                 elif event.type == pygame.KEYDOWN:
+                    self._needs_redraw = True
                     # Handle text input for editable fields on Current Tournament tab
                     if self.active_tab == "Current Tournament" and self.active_input_field:
                         if event.key == pygame.K_BACKSPACE:
@@ -431,12 +997,12 @@ class TournamentBracketGUI:
                             
                             self.active_input_field = None
                             self.input_text = ""
-                            self.save_current_tournament()
+                            self._queue_save()
                         elif event.key == pygame.K_ESCAPE:
                             # Cancel editing
                             self.active_input_field = None
                             self.input_text = ""
-                        elif event.unicode.isprintable() and len(self.input_text) < 50:
+                        elif _is_text_key(event.unicode) and len(self.input_text) < 50:
                             self.input_text += event.unicode
                     # Handle text input for player names on Player List tab
                     elif self.active_tab == "Player List":
@@ -446,8 +1012,8 @@ class TournamentBracketGUI:
                             self.editing_players.append(self.new_player_name.strip())
                             self.new_player_name = ""
                             self._recalculate_scaling()
-                            self.save_current_tournament()
-                        elif event.unicode.isprintable() and len(self.new_player_name) < 30:
+                            self._queue_save()
+                        elif _is_text_key(event.unicode) and len(self.new_player_name) < 30:
                             self.new_player_name += event.unicode
                     else:
                         if event.key == pygame.K_ESCAPE:
@@ -463,28 +1029,63 @@ class TournamentBracketGUI:
                         elif event.key == pygame.K_h:
                             self.show_instructions = not self.show_instructions
             
-            # Update cursor blink animation (every 30 frames = 0.5 seconds at 60 FPS)
-            self.cursor_timer += 1
-            if self.cursor_timer >= 30:
-                self.cursor_visible = not self.cursor_visible
-                self.cursor_timer = 0
-            
-            self._draw()
-            pygame.display.flip()
-            self.clock.tick(60)
-        
+            if animating:
+                # Update cursor blink animation (every 30 frames = 0.5 seconds at 60 FPS)
+                self.cursor_timer += 1
+                if self.cursor_timer >= 30:
+                    self.cursor_visible = not self.cursor_visible
+                    self.cursor_timer = 0
+                    self._needs_redraw = True
+                if self.tour_active:
+                    # Highlight pulse animates continuously
+                    self._needs_redraw = True
+
+            # Batch rapid edits (typing, quick clicks) into one disk write
+            # at most every 500ms instead of one write per keystroke.
+            if self._save_pending and pygame.time.get_ticks() - self._last_save_ticks >= 500:
+                self._flush_pending_save()
+
+            if self._needs_redraw:
+                self._draw()
+                pygame.display.flip()
+                self._needs_redraw = False
+                self.clock.tick(60)
+
+        # No sys.exit(): let callers (and the interpreter) wind down
+        # naturally after pygame releases the display
+        self._flush_pending_save()
         pygame.quit()
-        sys.exit()
     
+    def _build_background(self) -> pygame.Surface:
+        """Render the vertical gradient once; _draw just blits it.
+
+        The per-row colors never change between frames, so the old
+        per-frame loop of height draw.line calls was pure waste. With
+        numpy the rows are computed vectorized through surfarray;
+        otherwise fall back to the line loop, still paid only once.
+        """
+        surface = pygame.Surface((self.width, self.height))
+        if np is not None:
+            ratio = np.linspace(0.0, 0.05, self.height, endpoint=False)[None, :, None]
+            light = np.asarray(LIGHT_GRAY, dtype=np.float64)
+            off = np.asarray(OFF_WHITE, dtype=np.float64)
+            rows = (light * (1 - ratio) + off * ratio).astype(np.uint8)
+            pixels = pygame.surfarray.pixels3d(surface)
+            pixels[:] = rows  # broadcast one row of colors down every column
+            del pixels  # unlock the surface
+        else:
+            for y in range(self.height):
+                ratio = y / self.height
+                r = int(LIGHT_GRAY[0] * (1 - ratio * 0.05) + OFF_WHITE[0] * (ratio * 0.05))
+                g = int(LIGHT_GRAY[1] * (1 - ratio * 0.05) + OFF_WHITE[1] * (ratio * 0.05))
+                b = int(LIGHT_GRAY[2] * (1 - ratio * 0.05) + OFF_WHITE[2] * (ratio * 0.05))
+                pygame.draw.line(surface, (r, g, b), (0, y), (self.width, y))
+        return surface.convert()
+
     def _draw(self):
-        # Modern gradient background
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(LIGHT_GRAY[0] * (1 - ratio * 0.05) + OFF_WHITE[0] * (ratio * 0.05))
-            g = int(LIGHT_GRAY[1] * (1 - ratio * 0.05) + OFF_WHITE[1] * (ratio * 0.05))
-            b = int(LIGHT_GRAY[2] * (1 - ratio * 0.05) + OFF_WHITE[2] * (ratio * 0.05))
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
-        
+        # Modern gradient background, pre-rendered once
+        self.screen.blit(self._gradient_bg, (0, 0))
+
         # Draw tabs
         self._draw_tabs()
         
@@ -539,7 +1140,7 @@ class TournamentBracketGUI:
             
             # Draw tab text with better color
             text_color = CHARCOAL if tab_name == self.active_tab else DARK_GRAY
-            text_surface = self.round_font.render(tab_name, True, text_color)
+            text_surface = self._render_text(self.round_font, tab_name, True, text_color)
             text_rect = text_surface.get_rect(center=(x + tab_width / 2, self.tab_height / 2))
             self.screen.blit(text_surface, text_rect)
         
@@ -583,11 +1184,11 @@ class TournamentBracketGUI:
         if not self.bracket:
             # No bracket generated yet
             y_offset = self.height // 2 - 50
-            msg = self.round_font.render("No bracket generated yet", True, DARK_GRAY)
+            msg = self._render_text(self.round_font, "No bracket generated yet", True, DARK_GRAY)
             msg_rect = msg.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(msg, msg_rect)
             
-            msg2 = self.small_font.render("Add players in 'Player List' tab and click 'Generate Bracket'", True, DARK_GRAY)
+            msg2 = self._render_text(self.small_font, "Add players in 'Player List' tab and click 'Generate Bracket'", True, DARK_GRAY)
             msg2_rect = msg2.get_rect(center=(self.width // 2, y_offset + 40))
             self.screen.blit(msg2, msg2_rect)
             return
@@ -600,13 +1201,12 @@ class TournamentBracketGUI:
             title_text = "Tournament Bracket"
             title_color = BLACK
         
-        title_surface = self.title_font.render(title_text, True, title_color)
+        title_surface = self._render_text(self.title_font, title_text, True, title_color)
         title_rect = title_surface.get_rect(center=(self.width // 2, self.tab_height + 40))
         self.screen.blit(title_surface, title_rect)
         
         self._draw_rounds()
-        self._draw_connections()
-        
+
         if self.show_instructions:
             self._draw_instructions()
         
@@ -618,7 +1218,7 @@ class TournamentBracketGUI:
         y_offset = self.tab_height + 80
         
         # Title
-        title = self.title_font.render("Tournaments", True, BLUE)
+        title = self._render_text(self.title_font, "Tournaments", True, BLUE)
         title_rect = title.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(title, title_rect)
         
@@ -626,7 +1226,7 @@ class TournamentBracketGUI:
         
         if not self.tournaments_list:
             # No tournaments message
-            no_tournaments = self.round_font.render("No tournaments yet. Click 'Create New' to start!", True, DARK_GRAY)
+            no_tournaments = self._render_text(self.round_font, "No tournaments yet. Click 'Create New' to start!", True, DARK_GRAY)
             no_tournaments_rect = no_tournaments.get_rect(center=(self.width // 2, y_offset + 100))
             self.screen.blit(no_tournaments, no_tournaments_rect)
         else:
@@ -640,11 +1240,11 @@ class TournamentBracketGUI:
                 pygame.draw.rect(self.screen, BLUE, tournament_rect, 2, border_radius=5)
                 
                 # Tournament name
-                name_text = self.round_font.render(tournament.name, True, BLACK)
+                name_text = self._render_text(self.round_font, tournament.name, True, BLACK)
                 self.screen.blit(name_text, (120, y_offset + 10))
                 
                 # Location and date
-                info_text = self.small_font.render(
+                info_text = self._render_text(self.small_font, 
                     f"📍 {tournament.location} | 📅 {tournament.date_scheduled} {tournament.time_scheduled}",
                     True, DARK_GRAY
                 )
@@ -656,7 +1256,7 @@ class TournamentBracketGUI:
         create_button_rect = pygame.Rect(self.width // 2 - 120, self.height - 80, 240, 50)
         pygame.draw.rect(self.screen, GREEN, create_button_rect, border_radius=5)
         pygame.draw.rect(self.screen, DARK_GRAY, create_button_rect, 2, border_radius=5)
-        create_text = self.button_font.render("Create New Tournament", True, WHITE)
+        create_text = self._render_text(self.button_font, "Create New Tournament", True, WHITE)
         create_text_rect = create_text.get_rect(center=create_button_rect.center)
         self.screen.blit(create_text, create_text_rect)
     
@@ -665,11 +1265,11 @@ class TournamentBracketGUI:
         if not self.current_metadata:
             # No tournament selected
             y_offset = self.height // 2 - 50
-            msg = self.round_font.render("No tournament selected", True, DARK_GRAY)
+            msg = self._render_text(self.round_font, "No tournament selected", True, DARK_GRAY)
             msg_rect = msg.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(msg, msg_rect)
             
-            msg2 = self.small_font.render("Go to 'Tournaments' tab to create or load a tournament", True, DARK_GRAY)
+            msg2 = self._render_text(self.small_font, "Go to 'Tournaments' tab to create or load a tournament", True, DARK_GRAY)
             msg2_rect = msg2.get_rect(center=(self.width // 2, y_offset + 40))
             self.screen.blit(msg2, msg2_rect)
             return
@@ -677,14 +1277,14 @@ class TournamentBracketGUI:
         y_offset = self.tab_height + 80
         
         # Title
-        title = self.title_font.render("Current Tournament", True, BLUE)
+        title = self._render_text(self.title_font, "Current Tournament", True, BLUE)
         title_rect = title.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(title, title_rect)
         
         y_offset += 80
         
         # Tournament name - EDITABLE
-        name_label = self.round_font.render("Name:", True, CHARCOAL)
+        name_label = self._render_text(self.round_font, "Name:", True, CHARCOAL)
         self.screen.blit(name_label, (100, y_offset))
         
         name_rect = pygame.Rect(300, y_offset - 8, 500, 40)
@@ -698,15 +1298,15 @@ class TournamentBracketGUI:
             self._draw_card(name_rect, LIGHT_GRAY, MED_GRAY, shadow=False)
             display_text = self.current_metadata.name
             # Add edit icon hint
-            edit_hint = self.small_font.render("✎ click to edit", True, MED_GRAY)
+            edit_hint = self._render_text(self.small_font, "✎ click to edit", True, MED_GRAY)
             self.screen.blit(edit_hint, (name_rect.right + 10, name_rect.centery - 8))
         
-        name_text = self.player_font.render(display_text, True, CHARCOAL)
+        name_text = self._render_text(self.player_font, display_text, True, CHARCOAL)
         self.screen.blit(name_text, (name_rect.x + 12, name_rect.y + 10))
         y_offset += 60
         
         # Location - EDITABLE
-        location_label = self.round_font.render("Location:", True, CHARCOAL)
+        location_label = self._render_text(self.round_font, "Location:", True, CHARCOAL)
         self.screen.blit(location_label, (100, y_offset))
         
         location_rect = pygame.Rect(300, y_offset - 8, 500, 40)
@@ -718,15 +1318,15 @@ class TournamentBracketGUI:
         else:
             self._draw_card(location_rect, LIGHT_GRAY, MED_GRAY, shadow=False)
             display_text = self.current_metadata.location
-            edit_hint = self.small_font.render("✎ click to edit", True, MED_GRAY)
+            edit_hint = self._render_text(self.small_font, "✎ click to edit", True, MED_GRAY)
             self.screen.blit(edit_hint, (location_rect.right + 10, location_rect.centery - 8))
         
-        location_text = self.player_font.render(display_text, True, CHARCOAL)
+        location_text = self._render_text(self.player_font, display_text, True, CHARCOAL)
         self.screen.blit(location_text, (location_rect.x + 12, location_rect.y + 10))
         y_offset += 60
         
         # Date scheduled - EDITABLE
-        date_label = self.round_font.render("Date:", True, CHARCOAL)
+        date_label = self._render_text(self.round_font, "Date:", True, CHARCOAL)
         self.screen.blit(date_label, (100, y_offset))
         
         date_rect = pygame.Rect(300, y_offset - 8, 250, 40)
@@ -738,10 +1338,10 @@ class TournamentBracketGUI:
         else:
             self._draw_card(date_rect, LIGHT_GRAY, MED_GRAY, shadow=False)
             display_text = self.current_metadata.date_scheduled
-            edit_hint = self.small_font.render("✎", True, MED_GRAY)
+            edit_hint = self._render_text(self.small_font, "✎", True, MED_GRAY)
             self.screen.blit(edit_hint, (date_rect.right + 10, date_rect.centery - 8))
         
-        date_text = self.player_font.render(display_text, True, CHARCOAL)
+        date_text = self._render_text(self.player_font, display_text, True, CHARCOAL)
         self.screen.blit(date_text, (date_rect.x + 12, date_rect.y + 10))
         
         # Time scheduled - EDITABLE
@@ -754,50 +1354,50 @@ class TournamentBracketGUI:
         else:
             self._draw_card(time_rect, LIGHT_GRAY, MED_GRAY, shadow=False)
             display_text = self.current_metadata.time_scheduled
-            edit_hint = self.small_font.render("✎", True, MED_GRAY)
+            edit_hint = self._render_text(self.small_font, "✎", True, MED_GRAY)
             self.screen.blit(edit_hint, (time_rect.right + 10, time_rect.centery - 8))
         
-        time_text = self.player_font.render(display_text, True, CHARCOAL)
+        time_text = self._render_text(self.player_font, display_text, True, CHARCOAL)
         self.screen.blit(time_text, (time_rect.x + 12, time_rect.y + 10))
         y_offset += 60
         
         # Date created
-        created_label = self.round_font.render("Created:", True, BLACK)
+        created_label = self._render_text(self.round_font, "Created:", True, BLACK)
         self.screen.blit(created_label, (100, y_offset))
         created_date = self.current_metadata.date_created.split('T')[0]  # Get date part
-        created_text = self.player_font.render(created_date, True, DARK_GRAY)
+        created_text = self._render_text(self.player_font, created_date, True, DARK_GRAY)
         self.screen.blit(created_text, (300, y_offset))
         y_offset += 60
         
         # Number of participants
-        participants_label = self.round_font.render("Participants:", True, BLACK)
+        participants_label = self._render_text(self.round_font, "Participants:", True, BLACK)
         self.screen.blit(participants_label, (100, y_offset))
-        participant_text = self.player_font.render(f"{len(self.editing_players)} players", True, DARK_GRAY)
+        participant_text = self._render_text(self.player_font, f"{len(self.editing_players)} players", True, DARK_GRAY)
         self.screen.blit(participant_text, (300, y_offset))
         y_offset += 50
         
         # Tournament format
-        format_label = self.round_font.render("Format:", True, BLACK)
+        format_label = self._render_text(self.round_font, "Format:", True, BLACK)
         self.screen.blit(format_label, (100, y_offset))
-        format_text = self.player_font.render("Single Elimination", True, DARK_GRAY)
+        format_text = self._render_text(self.player_font, "Single Elimination", True, DARK_GRAY)
         self.screen.blit(format_text, (300, y_offset))
         y_offset += 50
         
         # Rounds (if bracket exists)
         if self.bracket:
-            rounds_label = self.round_font.render("Rounds:", True, BLACK)
+            rounds_label = self._render_text(self.round_font, "Rounds:", True, BLACK)
             self.screen.blit(rounds_label, (100, y_offset))
-            rounds_text = self.player_font.render(f"{self.num_rounds} rounds", True, DARK_GRAY)
+            rounds_text = self._render_text(self.player_font, f"{self.num_rounds} rounds", True, DARK_GRAY)
             self.screen.blit(rounds_text, (300, y_offset))
             y_offset += 60
         
         # Status
         if self.bracket and self.bracket.get_champion():
-            status_text = self.round_font.render("Status: COMPLETED", True, GOLD)
+            status_text = self._render_text(self.round_font, "Status: COMPLETED", True, GOLD)
         elif self.bracket:
-            status_text = self.round_font.render("Status: IN PROGRESS", True, GREEN)
+            status_text = self._render_text(self.round_font, "Status: IN PROGRESS", True, GREEN)
         else:
-            status_text = self.round_font.render("Status: NOT STARTED", True, ORANGE)
+            status_text = self._render_text(self.round_font, "Status: NOT STARTED", True, ORANGE)
         
         status_rect = status_text.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(status_text, status_rect)
@@ -811,11 +1411,12 @@ class TournamentBracketGUI:
             "Switch to 'Final Results' to see tournament statistics"
         ]
         
+        lines = []
         for instruction in instructions:
-            inst_text = self.small_font.render(instruction, True, DARK_GRAY)
-            inst_rect = inst_text.get_rect(center=(self.width // 2, y_offset))
-            self.screen.blit(inst_text, inst_rect)
+            inst_text = self._render_text(self.small_font, instruction, True, DARK_GRAY)
+            lines.append((inst_text, inst_text.get_rect(center=(self.width // 2, y_offset))))
             y_offset += 30
+        self.screen.blits(lines, doreturn=0)
         
         # Dangerous Operations Panel
         panel_y = self.tab_height + 450
@@ -829,7 +1430,7 @@ class TournamentBracketGUI:
         # Draw warning icon and text
         warning_text = "⚠ DANGEROUS OPERATIONS"
         arrow = "▼" if self.dangerous_panel_open else "▶"
-        panel_label = self.round_font.render(f"{arrow} {warning_text}", True, WHITE)
+        panel_label = self._render_text(self.round_font, f"{arrow} {warning_text}", True, WHITE)
         panel_label_rect = panel_label.get_rect(center=(self.width // 2, panel_y + 20))
         self.screen.blit(panel_label, panel_label_rect)
         
@@ -840,32 +1441,24 @@ class TournamentBracketGUI:
             pygame.draw.rect(self.screen, RED, content_rect, 2, border_radius=5)
             
             # Warning message
-            warning_msg = self.small_font.render("These operations cannot be undone!", True, RED)
+            warning_msg = self._render_text(self.small_font, "These operations cannot be undone!", True, RED)
             warning_rect = warning_msg.get_rect(center=(self.width // 2, panel_y + 80))
             self.screen.blit(warning_msg, warning_rect)
             
             # Reset button
-            reset_btn_rect = pygame.Rect(self.width // 2 - 220, panel_y + 120, 200, 50)
-            pygame.draw.rect(self.screen, RED, reset_btn_rect, border_radius=5)
-            pygame.draw.rect(self.screen, DARK_GRAY, reset_btn_rect, 2, border_radius=5)
-            reset_text = self.button_font.render("Reset Tournament", True, WHITE)
-            reset_text_rect = reset_text.get_rect(center=reset_btn_rect.center)
-            self.screen.blit(reset_text, reset_text_rect)
-            
+            self.screen.blit(self._get_button_surface("Reset Tournament", 200, 50, RED),
+                             (self.width // 2 - 220, panel_y + 120))
+
             # Reshuffle button
-            reshuffle_btn_rect = pygame.Rect(self.width // 2 + 20, panel_y + 120, 200, 50)
-            pygame.draw.rect(self.screen, ORANGE, reshuffle_btn_rect, border_radius=5)
-            pygame.draw.rect(self.screen, DARK_GRAY, reshuffle_btn_rect, 2, border_radius=5)
-            reshuffle_text = self.button_font.render("Reshuffle Players", True, WHITE)
-            reshuffle_text_rect = reshuffle_text.get_rect(center=reshuffle_btn_rect.center)
-            self.screen.blit(reshuffle_text, reshuffle_text_rect)
+            self.screen.blit(self._get_button_surface("Reshuffle Players", 200, 50, ORANGE),
+                             (self.width // 2 + 20, panel_y + 120))
     
     def _draw_player_list_tab(self):
         """Draw the editable player list."""
         if not self.current_metadata:
             # No tournament selected
             y_offset = self.height // 2 - 50
-            msg = self.round_font.render("No tournament selected", True, DARK_GRAY)
+            msg = self._render_text(self.round_font, "No tournament selected", True, DARK_GRAY)
             msg_rect = msg.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(msg, msg_rect)
             return
@@ -873,81 +1466,99 @@ class TournamentBracketGUI:
         y_offset = self.tab_height + 80
         
         # Title
-        title = self.title_font.render("Player List", True, BLUE)
+        title = self._render_text(self.title_font, "Player List", True, BLUE)
         title_rect = title.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(title, title_rect)
         
         y_offset += 60
         
         # Subtitle
-        subtitle = self.round_font.render(f"Total Participants: {len(self.editing_players)}", True, DARK_GRAY)
+        subtitle = self._render_text(self.round_font, f"Total Participants: {len(self.editing_players)}", True, DARK_GRAY)
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(subtitle, subtitle_rect)
         
         y_offset += 60
         
         # Input field for new player
-        input_label = self.small_font.render("Add New Player:", True, BLACK)
+        input_label = self._render_text(self.small_font, "Add New Player:", True, BLACK)
         self.screen.blit(input_label, (self.width // 2 - 200, y_offset))
         
         input_box = pygame.Rect(self.width // 2 - 200, y_offset + 25, 400, 35)
         pygame.draw.rect(self.screen, WHITE, input_box, border_radius=5)
         pygame.draw.rect(self.screen, BLUE, input_box, 2, border_radius=5)
         
-        input_text = self.player_font.render(self.new_player_name + "|", True, BLACK)
+        input_text = self._render_text(self.player_font, self.new_player_name + "|", True, BLACK)
         self.screen.blit(input_text, (input_box.x + 10, input_box.y + 8))
         
         y_offset += 80
         
         # Player list
         if not self.editing_players:
-            no_players = self.small_font.render("No players yet. Add players above and press Enter or click 'Add Player'", True, DARK_GRAY)
+            no_players = self._render_text(self.small_font, "No players yet. Add players above and press Enter or click 'Add Player'", True, DARK_GRAY)
             no_players_rect = no_players.get_rect(center=(self.width // 2, y_offset + 50))
             self.screen.blit(no_players, no_players_rect)
         else:
+            # Boxes first, then every label in one batched blits() call:
+            # rows don't overlap, so deferring the text keeps z-order while
+            # amortizing the per-blit call overhead across the list
+            remove_text = self._render_text(self.small_font, "✕", True, WHITE)
+            labels = []
             for i, player in enumerate(self.editing_players):
                 y = y_offset + i * 35
-                
+
                 # Player box
                 player_box = pygame.Rect(self.width // 2 - 200, y, 360, 30)
                 pygame.draw.rect(self.screen, WHITE, player_box, border_radius=3)
                 pygame.draw.rect(self.screen, BLUE, player_box, 1, border_radius=3)
-                
+
                 # Player name
-                player_text = self.small_font.render(f"{i+1}. {player}", True, BLACK)
-                self.screen.blit(player_text, (player_box.x + 10, y + 6))
-                
+                player_text = self._render_text(self.small_font, f"{i+1}. {player}", True, BLACK)
+                labels.append((player_text, (player_box.x + 10, y + 6)))
+
                 # Remove button (X)
                 remove_btn = pygame.Rect(self.width // 2 + 180, y, 30, 30)
                 pygame.draw.rect(self.screen, RED, remove_btn, border_radius=3)
-                remove_text = self.small_font.render("✕", True, WHITE)
-                remove_text_rect = remove_text.get_rect(center=remove_btn.center)
-                self.screen.blit(remove_text, remove_text_rect)
+                labels.append((remove_text, remove_text.get_rect(center=remove_btn.center)))
+            self.screen.blits(labels, doreturn=0)
         
         # Add player button
-        add_button_rect = pygame.Rect(self.width // 2 - 100, self.height - 120, 200, 50)
         add_button_color = GREEN if self.new_player_name.strip() else GRAY
-        pygame.draw.rect(self.screen, add_button_color, add_button_rect, border_radius=5)
-        pygame.draw.rect(self.screen, DARK_GRAY, add_button_rect, 2, border_radius=5)
-        add_text = self.button_font.render("Add Player", True, WHITE)
-        add_text_rect = add_text.get_rect(center=add_button_rect.center)
-        self.screen.blit(add_text, add_text_rect)
-        
+        self.screen.blit(self._get_button_surface("Add Player", 200, 50, add_button_color),
+                         (self.width // 2 - 100, self.height - 120))
+
         # Generate bracket button
-        generate_button_rect = pygame.Rect(self.width // 2 - 120, self.height - 60, 240, 50)
         generate_button_color = BLUE if len(self.editing_players) >= 2 else GRAY
-        pygame.draw.rect(self.screen, generate_button_color, generate_button_rect, border_radius=5)
-        pygame.draw.rect(self.screen, DARK_GRAY, generate_button_rect, 2, border_radius=5)
-        generate_text = self.button_font.render("Generate Bracket", True, WHITE)
-        generate_text_rect = generate_text.get_rect(center=generate_button_rect.center)
-        self.screen.blit(generate_text, generate_text_rect)
+        self.screen.blit(self._get_button_surface("Generate Bracket", 240, 50, generate_button_color),
+                         (self.width // 2 - 120, self.height - 60))
     
-    def _draw_final_results_tab(self):
-        """Draw final results and statistics."""
-        if not self.bracket:
+    def _get_placements(self, champion: str) -> Tuple[Optional[str], List[str]]:
+        """(runner-up, semi-finalists), resolved once per completed bracket."""
+        if self._placements is None:
+            final_match = self.bracket.matches[-1][0]
+            runner_up = final_match.player1 if final_match.player2 == champion else final_match.player2
+            semi_finalists = []
+            if len(self.bracket.matches) > 1:
+                for match in self.bracket.matches[-2]:
+                    if match.player1 and match.player1 != champion and match.player1 != runner_up:
+                        semi_finalists.append(match.player1)
+                    if match.player2 and match.player2 != champion and match.player2 != runner_up:
+                        semi_finalists.append(match.player2)
+            self._placements = (runner_up, semi_finalists)
+        return self._placements
+
+    def _get_match_stats(self) -> Tuple[int, int]:
+        """(total, completed) match counts, cached until a result changes."""
+        if self._match_stats is None:
+            flat = self.bracket._all_matches
+            self._match_stats = (len(flat), sum(1 for m in flat if m.winner))
+        return self._match_stats
+
+    def _draw_final_results_tab(self):
+        """Draw final results and statistics."""
+        if not self.bracket:
             # No bracket yet
             y_offset = self.height // 2 - 50
-            msg = self.round_font.render("No tournament results yet", True, DARK_GRAY)
+            msg = self._render_text(self.round_font, "No tournament results yet", True, DARK_GRAY)
             msg_rect = msg.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(msg, msg_rect)
             return
@@ -955,7 +1566,7 @@ class TournamentBracketGUI:
         y_offset = self.tab_height + 80
         
         # Title
-        title = self.title_font.render("Final Results", True, BLUE)
+        title = self._render_text(self.title_font, "Final Results", True, BLUE)
         title_rect = title.get_rect(center=(self.width // 2, y_offset))
         self.screen.blit(title, title_rect)
         
@@ -966,7 +1577,7 @@ class TournamentBracketGUI:
         
         if champion:
             # Champion display
-            champion_label = self.round_font.render("CHAMPION", True, GOLD)
+            champion_label = self._render_text(self.round_font, "CHAMPION", True, GOLD)
             champion_rect = champion_label.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(champion_label, champion_rect)
             
@@ -980,64 +1591,52 @@ class TournamentBracketGUI:
             
             y_offset += 90
             
-            champion_name = self.title_font.render(champion, True, GOLD)
+            champion_name = self._render_text(self.title_font, champion, True, GOLD)
             champion_name_rect = champion_name.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(champion_name, champion_name_rect)
             
             y_offset += 80
             
-            # Get finalists from final match
-            final_match = self.bracket.matches[-1][0]
-            runner_up = final_match.player1 if final_match.player2 == champion else final_match.player2
-            
+            # Finalists and semi-finalists, cached once the bracket completes
+            runner_up, semi_finalists = self._get_placements(champion)
+
             if runner_up:
-                runner_label = self.round_font.render("Runner-Up (2nd Place)", True, DARK_GRAY)
+                runner_label = self._render_text(self.round_font, "Runner-Up (2nd Place)", True, DARK_GRAY)
                 runner_rect = runner_label.get_rect(center=(self.width // 2, y_offset))
                 self.screen.blit(runner_label, runner_rect)
                 
                 y_offset += 40
                 
-                runner_name = self.player_font.render(runner_up, True, BLACK)
+                runner_name = self._render_text(self.player_font, runner_up, True, BLACK)
                 runner_name_rect = runner_name.get_rect(center=(self.width // 2, y_offset))
                 self.screen.blit(runner_name, runner_name_rect)
                 
                 y_offset += 70
             
-            # Get semi-finalists if semifinals exist
-            if len(self.bracket.matches) > 1:
-                semi_matches = self.bracket.matches[-2]
-                semi_finalists = []
-                for match in semi_matches:
-                    if match.player1 and match.player1 != champion and match.player1 != runner_up:
-                        semi_finalists.append(match.player1)
-                    if match.player2 and match.player2 != champion and match.player2 != runner_up:
-                        semi_finalists.append(match.player2)
-                
-                if semi_finalists:
-                    semi_label = self.round_font.render("Semi-Finalists (3rd/4th Place)", True, DARK_GRAY)
-                    semi_rect = semi_label.get_rect(center=(self.width // 2, y_offset))
-                    self.screen.blit(semi_label, semi_rect)
-                    
-                    y_offset += 40
-                    
-                    for sf in semi_finalists[:2]:  # Max 2 semi-finalists
-                        sf_name = self.player_font.render(sf, True, BLACK)
-                        sf_rect = sf_name.get_rect(center=(self.width // 2, y_offset))
-                        self.screen.blit(sf_name, sf_rect)
-                        y_offset += 35
+            if semi_finalists:
+                semi_label = self._render_text(self.round_font, "Semi-Finalists (3rd/4th Place)", True, DARK_GRAY)
+                semi_rect = semi_label.get_rect(center=(self.width // 2, y_offset))
+                self.screen.blit(semi_label, semi_rect)
+
+                y_offset += 40
+
+                for sf in semi_finalists[:2]:  # Max 2 semi-finalists
+                    sf_name = self._render_text(self.player_font, sf, True, BLACK)
+                    sf_rect = sf_name.get_rect(center=(self.width // 2, y_offset))
+                    self.screen.blit(sf_name, sf_rect)
+                    y_offset += 35
             
             y_offset += 40
             
             # Tournament stats
-            stats_label = self.round_font.render("Tournament Statistics", True, BLUE)
+            stats_label = self._render_text(self.round_font, "Tournament Statistics", True, BLUE)
             stats_rect = stats_label.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(stats_label, stats_rect)
             
             y_offset += 50
             
-            total_matches = sum(len(round_matches) for round_matches in self.bracket.matches)
-            completed_matches = sum(1 for round_matches in self.bracket.matches for match in round_matches if match.winner)
-            
+            total_matches, completed_matches = self._get_match_stats()
+
             stats = [
                 f"Total Matches: {total_matches}",
                 f"Completed Matches: {completed_matches}",
@@ -1045,23 +1644,23 @@ class TournamentBracketGUI:
                 f"Participants: {self.num_participants}"
             ]
             
+            lines = []
             for stat in stats:
-                stat_text = self.small_font.render(stat, True, BLACK)
-                stat_rect = stat_text.get_rect(center=(self.width // 2, y_offset))
-                self.screen.blit(stat_text, stat_rect)
+                stat_text = self._render_text(self.small_font, stat, True, BLACK)
+                lines.append((stat_text, stat_text.get_rect(center=(self.width // 2, y_offset))))
                 y_offset += 30
+            self.screen.blits(lines, doreturn=0)
         else:
             # Tournament not complete
-            not_complete = self.round_font.render("Tournament Not Yet Complete", True, ORANGE)
+            not_complete = self._render_text(self.round_font, "Tournament Not Yet Complete", True, ORANGE)
             not_complete_rect = not_complete.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(not_complete, not_complete_rect)
             
             y_offset += 80
             
-            total_matches = sum(len(round_matches) for round_matches in self.bracket.matches)
-            completed_matches = sum(1 for round_matches in self.bracket.matches for match in round_matches if match.winner)
-            
-            progress_text = self.player_font.render(
+            total_matches, completed_matches = self._get_match_stats()
+
+            progress_text = self._render_text(self.player_font,
                 f"Progress: {completed_matches} of {total_matches} matches completed",
                 True, DARK_GRAY
             )
@@ -1070,14 +1669,13 @@ class TournamentBracketGUI:
             
             y_offset += 60
             
-            instruction = self.small_font.render(
+            instruction = self._render_text(self.small_font, 
                 "Switch to 'Bracket' tab to continue the tournament",
                 True, DARK_GRAY
             )
             instruction_rect = instruction.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(instruction, instruction_rect)
-        
-        champion = self.bracket.get_champion()
+
         if champion:
             title_text = f"CHAMPION: {champion}"
             title_color = GOLD
@@ -1085,13 +1683,12 @@ class TournamentBracketGUI:
             title_text = "Tournament Bracket"
             title_color = BLACK
         
-        title_surface = self.title_font.render(title_text, True, title_color)
+        title_surface = self._render_text(self.title_font, title_text, True, title_color)
         title_rect = title_surface.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title_surface, title_rect)
         
         self._draw_rounds()
-        self._draw_connections()
-        
+
         if self.show_instructions:
             self._draw_instructions()
         
@@ -1099,160 +1696,183 @@ class TournamentBracketGUI:
             self._draw_selection_prompt()
     
     def _draw_rounds(self):
-        num_rounds = self.bracket.num_rounds
-        round_spacing = (self.width - 100) / num_rounds
         start_y = self.tab_height + 120  # Offset for tab bar
-        
-        for round_num, round_matches in enumerate(self.bracket.matches, 1):
-            x = 50 + round_num * round_spacing - round_spacing / 2
-            
-            round_name = self.bracket._get_round_name(round_num)
-            round_surface = self.round_font.render(round_name, True, BLUE)
+
+        # Round labels stay fixed while the matches scroll underneath
+        for round_num in range(1, self.bracket.num_rounds + 1):
+            x = self._round_x[round_num - 1]
+            round_name = self.bracket.round_names[round_num - 1]
+            round_surface = self._render_text(self.round_font, round_name, True, BLUE)
             round_rect = round_surface.get_rect(center=(x, start_y))
             self.screen.blit(round_surface, round_rect)
-            
-            num_matches = len(round_matches)
-            match_spacing = self._get_match_spacing(num_matches)
-            
-            for idx, match in enumerate(round_matches):
-                y = start_y + 50 + idx * match_spacing + self.scroll_offset
-                
-                if -self.match_height < y < self.height:
-                    self._draw_match(match, x, y, round_num, idx)
-    
+
+        if self._bg_dirty or self._bg_surface is None:
+            self._rebuild_bg_surface()
+        self.screen.blit(self._bg_surface, (0, self.scroll_offset))
+
+        # Hover and selection are the only per-frame differences from the
+        # composited layer; redraw just those cards on top of it.
+        dynamic = set()
+        if self.selected_match:
+            dynamic.add(self.selected_match)
+        if self.hovered_player:
+            dynamic.add(self.hovered_player[:2])
+        for round_num, idx in dynamic:
+            x, y = self._match_pos[round_num - 1][idx]
+            y += self.scroll_offset
+            if -self.match_height < y < self.height:
+                self._draw_match(self.bracket.matches[round_num - 1][idx],
+                                 x, y, round_num, idx)
+
+    def _rebuild_bg_surface(self):
+        """Composite every match card into a full-height surface at scroll 0.
+
+        The bracket only changes when a result is recorded, so rendering it
+        once and blitting the cached surface each frame replaces hundreds of
+        per-frame draw calls with a single blit. The surface shares screen
+        coordinates (scrolling is applied at blit time), and _draw_match is
+        reused by pointing self.screen at the cache with the per-frame state
+        (scroll, hover, selection) temporarily zeroed out.
+        """
+        bottom = self.tab_height + 170 + self.match_height
+        for positions in self._match_pos:
+            bottom = max(bottom, positions[-1][1] + self.match_height)
+        surface = pygame.Surface((self.width, int(bottom) + 4), pygame.SRCALPHA)
+
+        screen = self.screen
+        scroll = self.scroll_offset
+        hovered = self.hovered_player
+        selected = self.selected_match
+        self.screen = surface
+        self.scroll_offset = 0
+        self.hovered_player = None
+        self.selected_match = None
+        try:
+            draw_match = self._draw_match
+            for round_num, round_matches in enumerate(self.bracket.matches, 1):
+                positions = self._match_pos[round_num - 1]
+                for idx, match in enumerate(round_matches):
+                    x, y = positions[idx]
+                    draw_match(match, x, y, round_num, idx)
+            self._draw_connections()
+        finally:
+            self.screen = screen
+            self.scroll_offset = scroll
+            self.hovered_player = hovered
+            self.selected_match = selected
+
+        # Match the display pixel format so the per-frame blit skips SDL's
+        # conversion path
+        self._bg_surface = surface.convert_alpha()
+        self._bg_dirty = False
+
     def _draw_match(self, match: Match, x: float, y: float, round_num: int, match_idx: int):
         is_selected = self.selected_match == (round_num, match_idx)
-        
-        box_rect = pygame.Rect(
-            x - self.match_width // 2,
-            y,
-            self.match_width,
-            self.match_height
-        )
-        
-        # Modern shadow with blur simulation
-        for i in range(3):
-            shadow_rect = box_rect.copy()
-            shadow_rect.x += 2 + i
-            shadow_rect.y += 3 + i
-            alpha = 15 - i * 5
-            shadow_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surf, (0, 0, 0, alpha), shadow_surf.get_rect(), border_radius=10)
-            self.screen.blit(shadow_surf, shadow_rect)
-        
-        # Card background
-        border_color = ACCENT_ORANGE if is_selected else PRIMARY
-        border_width = 3 if is_selected else 2
-        
-        # Glassmorphic effect
-        pygame.draw.rect(self.screen, OFF_WHITE, box_rect, border_radius=10)
-        
-        # Glow on selection
-        if is_selected:
-            glow = pygame.Surface((box_rect.width + 12, box_rect.height + 12), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (*ACCENT_ORANGE, 40), glow.get_rect(), border_radius=12)
-            self.screen.blit(glow, (box_rect.x - 6, box_rect.y - 6))
-        
-        pygame.draw.rect(self.screen, border_color, box_rect, border_width, border_radius=10)
-        
-        player1_rect = pygame.Rect(box_rect.x, box_rect.y, box_rect.width, self.player_height)
-        player2_rect = pygame.Rect(box_rect.x, box_rect.y + self.player_height, box_rect.width, self.player_height)
-        
+
+        # Persistent rects from the layout tables, shifted to the draw
+        # position (dy is the scroll offset, or 0 in the composited layer)
+        # Bind hot attributes once: this runs per match on every surface
+        # rebuild, and LOAD_ATTR in the loop body adds up
+        screen = self.screen
+        blit = screen.blit
+        draw_rect = pygame.draw.rect
+
+        dy = round(y - self._match_pos[round_num - 1][match_idx][1])
+        box_rect = self._match_rects[round_num - 1][match_idx].move(0, dy)
+
+        # Card chrome (shadow, fill, glow, border) comes pre-rendered
+        blit(self._get_box_template(is_selected), (box_rect.x - 6, box_rect.y - 6))
+
+        p1_base, p2_base = self._player_rects[round_num - 1][match_idx]
+        player1_rect = p1_base.move(0, dy)
+        player2_rect = p2_base.move(0, dy)
+
         self._draw_player(match, player1_rect, match.player1, 1, round_num, match_idx)
-        
+
         # Divider line with subtle gradient
         pygame.draw.line(
-            self.screen,
+            screen,
             MED_GRAY,
             (box_rect.x + 5, box_rect.y + self.player_height),
             (box_rect.x + box_rect.width - 5, box_rect.y + self.player_height),
             1
         )
-        
+
         self._draw_player(match, player2_rect, match.player2, 2, round_num, match_idx)
-        
+
         # Match number badge
         badge_rect = pygame.Rect(box_rect.x + 5, box_rect.y + box_rect.height - 22, 35, 18)
-        pygame.draw.rect(self.screen, PRIMARY_LIGHT, badge_rect, border_radius=4)
-        match_num_surface = self.small_font.render(f"M{match.match_id + 1}", True, PRIMARY_DARK)
+        draw_rect(screen, PRIMARY_LIGHT, badge_rect, border_radius=4)
+        match_num_surface = self._render_text(self.small_font, f"M{match.match_id + 1}", True, PRIMARY_DARK)
         text_rect = match_num_surface.get_rect(center=badge_rect.center)
-        self.screen.blit(match_num_surface, text_rect)
+        blit(match_num_surface, text_rect)
     
-    def _draw_player(self, match: Match, rect: pygame.Rect, player: Optional[str], 
+    def _draw_player(self, match: Match, rect: pygame.Rect, player: Optional[str],
                      player_num: int, round_num: int, match_idx: int):
-        is_hovered = self.hovered_player == (round_num, match_idx, player_num)
-        is_winner = player and match.winner == player
-        is_loser = player and match.winner and match.winner != player
-        
-        # Modern status colors
-        if is_winner:
-            bg_color = ACCENT_GREEN
-            text_color = WHITE
-        elif is_hovered and not match.winner and player:
-            bg_color = PRIMARY_LIGHT
-            text_color = PRIMARY_DARK
-        elif is_loser:
-            bg_color = OFF_WHITE
-            text_color = MED_GRAY
+        # Classify the slot once and index the color tables (module scope)
+        # instead of re-deriving bg/text colors from chained conditions
+        if not player:
+            state = _SLOT_BYE
+        elif match.winner == player:
+            state = _SLOT_WINNER
+        elif match.winner:
+            state = _SLOT_LOSER
+        elif self.hovered_player == (round_num, match_idx, player_num):
+            state = _SLOT_HOVERED
         else:
-            bg_color = OFF_WHITE
-            text_color = CHARCOAL
-        
+            state = _SLOT_PENDING
+        bg_color = _SLOT_BG_COLORS[state]
+        text_color = _SLOT_TEXT_COLORS[state]
+        is_winner = state == _SLOT_WINNER
+
+        screen = self.screen
+
         # Background with rounded corners for hover/winner
-        if is_winner or (is_hovered and not match.winner and player):
+        if is_winner or state == _SLOT_HOVERED:
             inner_rect = rect.inflate(-4, -4)
-            pygame.draw.rect(self.screen, bg_color, inner_rect, border_radius=6)
-        
+            pygame.draw.rect(screen, bg_color, inner_rect, border_radius=6)
+
         # Player name
         player_text = player if player else "BYE"
-        player_surface = self.player_font.render(player_text, True, text_color)
+        player_surface = self._render_text(self.player_font, player_text, True, text_color)
         text_rect = player_surface.get_rect(center=rect.center)
-        self.screen.blit(player_surface, text_rect)
-        
+        screen.blit(player_surface, text_rect)
+
         # Winner indicator - modern checkmark
         if is_winner:
             check_circle = pygame.Rect(rect.x + 8, rect.centery - 8, 16, 16)
-            pygame.draw.circle(self.screen, WHITE, check_circle.center, 8)
-            pygame.draw.circle(self.screen, ACCENT_GREEN, check_circle.center, 7)
-            check_surface = self.small_font.render("✓", True, WHITE)
+            pygame.draw.circle(screen, WHITE, check_circle.center, 8)
+            pygame.draw.circle(screen, ACCENT_GREEN, check_circle.center, 7)
+            check_surface = self._render_text(self.small_font, "✓", True, WHITE)
             check_rect = check_surface.get_rect(center=check_circle.center)
-            self.screen.blit(check_surface, check_rect)
+            screen.blit(check_surface, check_rect)
     
     def _draw_connections(self):
-        for round_num in range(1, self.bracket.num_rounds):
-            current_matches = self.bracket.matches[round_num - 1]
-            next_matches = self.bracket.matches[round_num]
-            
-            round_spacing = (self.width - 100) / self.bracket.num_rounds
-            start_y = self.tab_height + 120
-            
-            current_x = 50 + round_num * round_spacing - round_spacing / 2 + self.match_width // 2
-            next_x = 50 + (round_num + 1) * round_spacing - round_spacing / 2 - self.match_width // 2
-            
-            current_spacing = self._get_match_spacing(len(current_matches))
-            next_spacing = self._get_match_spacing(len(next_matches))
-            
-            for idx, next_match in enumerate(next_matches):
-                next_y = start_y + 50 + idx * next_spacing + self.match_height // 2 + self.scroll_offset
-                
-                match1_idx = idx * 2
-                match2_idx = idx * 2 + 1
-                
-                if match1_idx < len(current_matches):
-                    match1_y = start_y + 50 + match1_idx * current_spacing + self.match_height // 2 + self.scroll_offset
-                    pygame.draw.line(self.screen, BLUE, (current_x, match1_y), (next_x, next_y), 2)
-                
-                if match2_idx < len(current_matches):
-                    match2_y = start_y + 50 + match2_idx * current_spacing + self.match_height // 2 + self.scroll_offset
-                    pygame.draw.line(self.screen, BLUE, (current_x, match2_y), (next_x, next_y), 2)
+        offset = self.scroll_offset
+        screen = self.screen
+        draw_line = pygame.draw.line
+        for (x1, y1), (x2, y2) in self._connection_segments:
+            draw_line(screen, BLUE, (x1, y1 + offset), (x2, y2 + offset), 2)
     
+    def _get_dark_overlay(self, alpha: int, color=BLACK) -> pygame.Surface:
+        """Full-screen darkening layer, allocated once per fill/alpha combo.
+
+        Both dialogs showed this every frame via a fresh window-sized
+        surface; the fill is constant, so build it once and blit.
+        """
+        key = (alpha, color)
+        overlay = self._dark_overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((self.width, self.height)).convert()
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            self._dark_overlays[key] = overlay
+        return overlay
+
     def _draw_close_confirmation(self):
         """Draw the close confirmation dialog."""
         # Darken background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dark_overlay(180), (0, 0))
         
         # Dialog box
         dialog_rect = pygame.Rect(self.width // 2 - 200, self.height // 2 - 80, 400, 160)
@@ -1260,30 +1880,47 @@ class TournamentBracketGUI:
         pygame.draw.rect(self.screen, BLUE, dialog_rect, 3, border_radius=10)
         
         # Message
-        msg1 = self.round_font.render("Close Tournament?", True, BLACK)
+        msg1 = self._render_text(self.round_font, "Close Tournament?", True, BLACK)
         msg1_rect = msg1.get_rect(center=(self.width // 2, self.height // 2 - 40))
         self.screen.blit(msg1, msg1_rect)
         
-        msg2 = self.small_font.render("Progress will be saved automatically", True, DARK_GRAY)
+        msg2 = self._render_text(self.small_font, "Progress will be saved automatically", True, DARK_GRAY)
         msg2_rect = msg2.get_rect(center=(self.width // 2, self.height // 2 - 10))
         self.screen.blit(msg2, msg2_rect)
         
         # Yes button
-        yes_button = pygame.Rect(self.width // 2 - 120, self.height // 2 + 20, 100, 40)
-        pygame.draw.rect(self.screen, GREEN, yes_button, border_radius=5)
-        pygame.draw.rect(self.screen, DARK_GRAY, yes_button, 2, border_radius=5)
-        yes_text = self.button_font.render("Yes", True, WHITE)
-        yes_text_rect = yes_text.get_rect(center=yes_button.center)
-        self.screen.blit(yes_text, yes_text_rect)
-        
+        self.screen.blit(self._get_button_surface("Yes", 100, 40, GREEN),
+                         (self.width // 2 - 120, self.height // 2 + 20))
+
         # No button
-        no_button = pygame.Rect(self.width // 2 + 20, self.height // 2 + 20, 100, 40)
-        pygame.draw.rect(self.screen, RED, no_button, border_radius=5)
-        pygame.draw.rect(self.screen, DARK_GRAY, no_button, 2, border_radius=5)
-        no_text = self.button_font.render("No", True, WHITE)
-        no_text_rect = no_text.get_rect(center=no_button.center)
-        self.screen.blit(no_text, no_text_rect)
+        self.screen.blit(self._get_button_surface("No", 100, 40, RED),
+                         (self.width // 2 + 20, self.height // 2 + 20))
     
+    def _wrap_text(self, font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+        """Greedy word wrap, memoized per (font, text, width).
+
+        Measures with Font.size instead of rendering trial surfaces, so the
+        partial lines never hit the text cache; the final lines are only
+        rasterized (and cached) once the wrap points are known.
+        """
+        key = (id(font), text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = []
+            line = ""
+            for word in text.split(' '):
+                test_line = line + word + " "
+                if font.size(test_line)[0] > max_width:
+                    if line:
+                        lines.append(line)
+                    line = word + " "
+                else:
+                    line = test_line
+            if line:
+                lines.append(line)
+            self._wrap_cache[key] = lines
+        return lines
+
     def _draw_tour_overlay(self):
         """Draw the tour overlay with current step highlighted."""
         if not self.tour_active or self.tour_step_index >= len(self.tour_steps):
@@ -1292,9 +1929,7 @@ class TournamentBracketGUI:
         current_step = self.tour_steps[self.tour_step_index]
         
         # Semi-transparent dark overlay over entire screen
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dark_overlay(160, (0, 0, 0)), (0, 0))
         
         # If there's a highlight rect, cut out that area and draw highlight border
         if current_step.highlight_rect:
@@ -1304,79 +1939,56 @@ class TournamentBracketGUI:
             highlight_surface.fill((0, 0, 0, 0))
             self.screen.blit(highlight_surface, (x, y))
             
-            # Draw animated pulsing border around highlight
-            pulse = abs(math.sin(pygame.time.get_ticks() / 500))
-            border_color = (
-                int(PRIMARY[0] + (255 - PRIMARY[0]) * pulse),
-                int(PRIMARY[1] + (255 - PRIMARY[1]) * pulse),
-                int(PRIMARY[2] + (255 - PRIMARY[2]) * pulse)
-            )
+            # Draw animated pulsing border around highlight (~2s period,
+            # quantized to the precomputed color table)
+            border_color = _PULSE_COLORS[(pygame.time.get_ticks() >> 3) & 255]
             pygame.draw.rect(self.screen, border_color, (x - 4, y - 4, w + 8, h + 8), 4, border_radius=12)
             pygame.draw.rect(self.screen, WHITE, (x - 2, y - 2, w + 4, h + 4), 2, border_radius=10)
         
         # Tour info panel at bottom
-        panel_height = 220
-        panel_rect = pygame.Rect(50, self.height - panel_height - 20, self.width - 100, panel_height)
+        panel_rect = self._tour_panel_rect
         self._draw_card(panel_rect, OFF_WHITE, PRIMARY, shadow=True, glow=True)
         
         # Step counter
-        step_text = self.small_font.render(
+        step_text = self._render_text(self.small_font, 
             f"Step {self.tour_step_index + 1} of {len(self.tour_steps)}",
             True, MED_GRAY
         )
         self.screen.blit(step_text, (panel_rect.x + 20, panel_rect.y + 15))
         
         # Title
-        title = self.title_font.render(current_step.title, True, CHARCOAL)
+        title = self._render_text(self.title_font, current_step.title, True, CHARCOAL)
         self.screen.blit(title, (panel_rect.x + 20, panel_rect.y + 45))
         
-        # Description (word wrap)
+        # Description (word wrap, lines cached per step)
         desc_y = panel_rect.y + 85
         max_width = panel_rect.width - 40
-        words = current_step.description.split(' ')
-        line = ""
-        for word in words:
-            test_line = line + word + " "
-            test_surface = self.player_font.render(test_line, True, DARK_GRAY)
-            if test_surface.get_width() > max_width:
-                if line:
-                    desc_surface = self.player_font.render(line, True, DARK_GRAY)
-                    self.screen.blit(desc_surface, (panel_rect.x + 20, desc_y))
-                    desc_y += 25
-                line = word + " "
-            else:
-                line = test_line
-        if line:
-            desc_surface = self.player_font.render(line, True, DARK_GRAY)
+        for line in self._wrap_text(self.player_font, current_step.description, max_width):
+            desc_surface = self._render_text(self.player_font, line, True, DARK_GRAY)
             self.screen.blit(desc_surface, (panel_rect.x + 20, desc_y))
+            desc_y += 25
         
         # Action required text
         if current_step.action_required:
             action_y = panel_rect.y + 140
-            action_text = self.small_font.render(
+            action_text = self._render_text(self.small_font, 
                 f"→ {current_step.action_required}",
                 True, PRIMARY
             )
             self.screen.blit(action_text, (panel_rect.x + 20, action_y))
         
         # Navigation buttons
-        button_y = panel_rect.y + panel_height - 60
-        button_spacing = 120
-        
         # Previous button
         if self.tour_step_index > 0:
-            prev_rect = pygame.Rect(panel_rect.x + 20, button_y, 100, 40)
-            self._draw_button(prev_rect, "Previous", MED_GRAY, WHITE, self.button_font)
-        
+            self._draw_button(self._tour_prev_rect, "Previous", MED_GRAY, WHITE, self.button_font)
+
         # Next/Finish button
         is_last = self.tour_step_index == len(self.tour_steps) - 1
         next_text = "Finish" if is_last else "Next"
-        next_rect = pygame.Rect(panel_rect.x + 140, button_y, 100, 40)
-        self._draw_button(next_rect, next_text, PRIMARY, WHITE, self.button_font)
-        
+        self._draw_button(self._tour_next_rect, next_text, PRIMARY, WHITE, self.button_font)
+
         # Skip tour button
-        skip_rect = pygame.Rect(panel_rect.right - 120, button_y, 100, 40)
-        self._draw_button(skip_rect, "Skip Tour", ACCENT_RED, WHITE, self.button_font)
+        self._draw_button(self._tour_skip_rect, "Skip Tour", ACCENT_RED, WHITE, self.button_font)
     
     def _handle_tour_click(self, pos: Tuple[int, int]) -> bool:
         """Handle clicks on tour overlay. Returns True if click was handled."""
@@ -1384,26 +1996,20 @@ class TournamentBracketGUI:
             return False
         
         mx, my = pos
-        panel_height = 220
-        panel_rect = pygame.Rect(50, self.height - panel_height - 20, self.width - 100, panel_height)
-        button_y = panel_rect.y + panel_height - 60
-        
+
         # Previous button
         if self.tour_step_index > 0:
-            prev_rect = pygame.Rect(panel_rect.x + 20, button_y, 100, 40)
-            if prev_rect.collidepoint(mx, my):
+            if self._tour_prev_rect.collidepoint(mx, my):
                 self.prev_tour_step()
                 return True
-        
+
         # Next/Finish button
-        next_rect = pygame.Rect(panel_rect.x + 140, button_y, 100, 40)
-        if next_rect.collidepoint(mx, my):
+        if self._tour_next_rect.collidepoint(mx, my):
             self.next_tour_step()
             return True
-        
+
         # Skip tour button
-        skip_rect = pygame.Rect(panel_rect.right - 120, button_y, 100, 40)
-        if skip_rect.collidepoint(mx, my):
+        if self._tour_skip_rect.collidepoint(mx, my):
             self.end_tour()
             return True
         
@@ -1411,25 +2017,38 @@ class TournamentBracketGUI:
         if current_step := self.tour_steps[self.tour_step_index]:
             if current_step.highlight_rect:
                 x, y, w, h = current_step.highlight_rect
-                if x <= mx <= x + w and y <= my <= y + h:
+                # Offset form halves the comparisons of the chained check
+                if 0 <= mx - x <= w and 0 <= my - y <= h:
                     return False  # Allow click through to highlighted element
         
         return True  # Block all other clicks
     
+    INSTRUCTIONS = (
+        "Click on a match, then click a player to select winner",
+        "Press H to hide/show instructions",
+        "Press ESC to cancel selection",
+        "Scroll to navigate | Auto-saves progress"
+    )
+
     def _draw_instructions(self):
-        instructions = [
-            "Click on a match, then click a player to select winner",
-            "Press H to hide/show instructions",
-            "Press ESC to cancel selection",
-            "Scroll to navigate | Auto-saves progress"
-        ]
-        
-        y = self.height - 100
-        for instruction in instructions:
-            text_surface = self.small_font.render(instruction, True, DARK_GRAY)
-            text_rect = text_surface.get_rect(center=(self.width // 2, y))
-            self.screen.blit(text_surface, text_rect)
-            y += 22
+        # The four lines never change for a given font size, so they are
+        # composited once and blitted as a single surface (rebuilt when
+        # _recalculate_scaling swaps fonts)
+        if self._instructions_surface is None:
+            surfs = [self._render_text(self.small_font, line, True, DARK_GRAY)
+                     for line in self.INSTRUCTIONS]
+            pad = max(s.get_height() for s in surfs) // 2 + 1
+            width = max(s.get_width() for s in surfs)
+            surface = pygame.Surface((width, 2 * pad + 22 * (len(surfs) - 1)),
+                                     pygame.SRCALPHA)
+            for i, s in enumerate(surfs):
+                surface.blit(s, s.get_rect(center=(width // 2, pad + 22 * i)))
+            self._instructions_surface = surface.convert_alpha()
+
+        surface = self._instructions_surface
+        # First line center sits at height - 100, matching the old loop
+        top = self.height - 100 - (surface.get_height() - 22 * (len(self.INSTRUCTIONS) - 1)) // 2
+        self.screen.blit(surface, (self.width // 2 - surface.get_width() // 2, top))
     
     def _draw_selection_prompt(self):
         round_num, match_idx = self.selected_match
@@ -1437,13 +2056,21 @@ class TournamentBracketGUI:
         
         if not match.winner and match.player1 and match.player2:
             prompt = f"Select winner: {match.player1} or {match.player2}"
-            prompt_surface = self.round_font.render(prompt, True, ORANGE)
+            prompt_surface = self._render_text(self.round_font, prompt, True, ORANGE)
             prompt_rect = prompt_surface.get_rect(center=(self.width // 2, 90))
             
             bg_rect = prompt_rect.inflate(20, 10)
-            pygame.draw.rect(self.screen, WHITE, bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, ORANGE, bg_rect, 2, border_radius=5)
-            
+            bg = self._prompt_bg_cache.get(bg_rect.size)
+            if bg is None:
+                # Rounded-rect rasterization is the per-frame cost here;
+                # bake the backdrop once per prompt size
+                bg = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(bg, WHITE, bg.get_rect(), border_radius=5)
+                pygame.draw.rect(bg, ORANGE, bg.get_rect(), 2, border_radius=5)
+                bg = bg.convert_alpha()
+                self._prompt_bg_cache[bg_rect.size] = bg
+            self.screen.blit(bg, bg_rect.topleft)
+
             self.screen.blit(prompt_surface, prompt_rect)
     
     def create_new_tournament(self, name: str, location: str, date_scheduled: str, time_scheduled: str):
@@ -1460,8 +2087,11 @@ class TournamentBracketGUI:
         
         self.current_tournament_id = tournament_id
         self.current_metadata = metadata
+        # Keep the in-memory list current (sorted newest-first) instead of
+        # re-reading the tournaments directory.
+        self.tournaments_list.insert(0, metadata)
         self.editing_players = []
-        self.initial_participants = []
+        self.initial_participants = ()
         self.bracket = None
         self.selected_match = None
         self.scroll_offset = 0
@@ -1476,31 +2106,67 @@ class TournamentBracketGUI:
             self._recalculate_scaling()
             self.selected_match = None
             self.scroll_offset = 0
-            self.save_current_tournament()
-    
+            self._queue_save()
+
     def reshuffle_tournament(self):
         """Reshuffle participants and reset tournament."""
         if self.editing_players:
-            shuffled = self.editing_players.copy()
-            random.shuffle(shuffled)
+            if np is not None:
+                # numpy's C Fisher-Yates beats random.shuffle once player
+                # lists get large
+                order = np.random.default_rng().permutation(len(self.editing_players))
+                shuffled = [self.editing_players[i] for i in order]
+            else:
+                shuffled = self.editing_players.copy()
+                random.shuffle(shuffled)
             self.editing_players = shuffled
-            self.bracket = TournamentBracket(shuffled)
+            if (self.bracket is not None
+                    and self.bracket.num_participants == len(shuffled)):
+                # Same structure, new order: mutate in place
+                self.bracket.reseed(shuffled)
+            else:
+                self.bracket = TournamentBracket(shuffled)
             self._recalculate_scaling()
             self.selected_match = None
             self.scroll_offset = 0
-            self.save_current_tournament()
-    
+            self._queue_save()
+
     def generate_bracket(self):
         """Generate bracket from current player list."""
         if self.editing_players:
             self.bracket = TournamentBracket(self.editing_players)
             self._recalculate_scaling()
-            self.initial_participants = self.editing_players.copy()
+            self.initial_participants = tuple(self.editing_players)
             self.selected_match = None
             self.scroll_offset = 0
-            self.save_current_tournament()
+            self._queue_save()
             self.active_tab = "Bracket"
-    
+
+    def record_winner(self, round_num: int, match_index: int, winner: str) -> bool:
+        """Record a match result and invalidate everything derived from it.
+
+        The bracket layer, match stats and placements are all cached off the
+        bracket state, so any caller that mutates a result must come through
+        here (not bracket.set_match_winner directly) or stale caches will
+        keep drawing the old bracket."""
+        if not self.bracket.set_match_winner(round_num, match_index, winner):
+            return False
+        self._bg_dirty = True
+        self._match_stats = None
+        self._placements = None
+        return True
+
+    def _queue_save(self):
+        """Request a save; the main loop batches bursts into one write."""
+        self._save_pending = True
+
+    def _flush_pending_save(self):
+        """Write queued changes out, if any."""
+        if self._save_pending:
+            self._save_pending = False
+            self.save_current_tournament()
+            self._last_save_ticks = pygame.time.get_ticks()
+
     def save_current_tournament(self):
         """Save current tournament state to disk."""
         if not self.current_tournament_id or not self.current_metadata:
@@ -1513,24 +2179,28 @@ class TournamentBracketGUI:
                 "bracket": self.bracket.to_dict() if self.bracket else None
             }
             
-            filepath = self.tournaments_dir / f"{self.current_tournament_id}.json"
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_tournament_file(self.tournaments_dir, self.current_tournament_id, data)
+
+            # Mirror metadata edits (e.g. renames) into the cached list
+            for i, t in enumerate(self.tournaments_list):
+                if t.id == self.current_tournament_id:
+                    self.tournaments_list[i] = self.current_metadata
+                    break
         except Exception as e:
             print(f"Error saving tournament: {e}")
     
     def load_tournament(self, tournament_id: str):
         """Load a specific tournament."""
+        self._flush_pending_save()
         try:
-            filepath = self.tournaments_dir / f"{tournament_id}.json"
-            if filepath.exists():
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                
+            filepath = find_tournament_file(self.tournaments_dir, tournament_id)
+            if filepath is not None:
+                data = read_tournament_file(filepath)
+
                 self.current_tournament_id = tournament_id
                 self.current_metadata = TournamentMetadata.from_dict(data["metadata"])
                 self.editing_players = data.get("participants", [])
-                self.initial_participants = self.editing_players.copy()
+                self.initial_participants = tuple(self.editing_players)
                 
                 if data.get("bracket"):
                     self.bracket = TournamentBracket.from_dict(data["bracket"])
@@ -1545,112 +2215,7 @@ class TournamentBracketGUI:
     
     def _initialize_tour_steps(self):
         """Initialize the user tour with all feature highlights."""
-        self.tour_steps = [
-            TourStep(
-                id="welcome",
-                title="Welcome to Tournament Manager!",
-                description="This tour will walk you through all the features. Press T to start the tour anytime, or ESC to skip.",
-                tab="Tournaments",
-                highlight_rect=None,
-                action_required="Click 'Next' to continue"
-            ),
-            TourStep(
-                id="create_tournament",
-                title="Creating Tournaments",
-                description="Click the 'Create New Tournament' button to create a tournament. Each tournament has a name, location, and scheduled date/time.",
-                tab="Tournaments",
-                highlight_rect=(self.width // 2 - 120, self.height - 80, 240, 50),
-                action_required="Create a tournament to continue"
-            ),
-            TourStep(
-                id="tournament_list",
-                title="Tournament List",
-                description="All your tournaments are listed here. Click any tournament to view and edit it.",
-                tab="Tournaments",
-                highlight_rect=(100, self.tab_height + 120, self.width - 200, 300),
-                action_required="Select a tournament to continue"
-            ),
-            TourStep(
-                id="edit_tournament_info",
-                title="Editable Tournament Details",
-                description="You can edit the tournament name, location, date, and time by clicking on them. Notice the edit icons (✎) indicating editable fields.",
-                tab="Current Tournament",
-                highlight_rect=(100, self.tab_height + 80, 800, 180),
-                action_required="Try editing a field (optional)"
-            ),
-            TourStep(
-                id="add_players",
-                title="Managing Players",
-                description="Add players to your tournament here. Type a name and press Enter or click 'Add Player'. You can also remove players with the X button.",
-                tab="Player List",
-                highlight_rect=(self.width // 2 - 250, self.tab_height + 120, 500, 400),
-                action_required="Add at least 2 players to continue"
-            ),
-            TourStep(
-                id="generate_bracket",
-                title="Generate Bracket",
-                description="Once you have at least 2 players, click 'Generate Bracket' to create the tournament structure. Byes are automatically assigned if needed.",
-                tab="Player List",
-                highlight_rect=(self.width // 2 - 120, self.height - 60, 240, 50),
-                action_required="Generate the bracket"
-            ),
-            TourStep(
-                id="view_bracket",
-                title="Tournament Bracket",
-                description="Here's your tournament bracket! Click on a match to select it, then click a player's name to declare them the winner. Winners advance automatically.",
-                tab="Bracket",
-                highlight_rect=(50, self.tab_height + 120, self.width - 100, 400),
-                action_required="Select a match and choose a winner"
-            ),
-            TourStep(
-                id="match_selection",
-                title="Match Interaction",
-                description="Selected matches are highlighted with a blue glow. Only matches with both players can have winners declared. Winners get green checkmarks.",
-                tab="Bracket",
-                highlight_rect=None,
-                action_required="Try selecting different matches"
-            ),
-            TourStep(
-                id="final_results",
-                title="Final Results",
-                description="Once the tournament is complete, view the final standings here. The champion is highlighted in gold!",
-                tab="Final Results",
-                highlight_rect=(self.width // 2 - 150, self.tab_height + 80, 300, 500),
-                action_required=None
-            ),
-            TourStep(
-                id="dangerous_operations",
-                title="Dangerous Operations",
-                description="The 'Dangerous Operations' panel on the Current Tournament tab lets you reset (clear all winners) or reshuffle (regenerate with same players).",
-                tab="Current Tournament",
-                highlight_rect=(100, self.tab_height + 450, self.width - 200, 150),
-                action_required=None
-            ),
-            TourStep(
-                id="auto_save",
-                title="Automatic Saving",
-                description="All changes are automatically saved! Your tournaments, players, and match results persist between sessions.",
-                tab="Current Tournament",
-                highlight_rect=None,
-                action_required=None
-            ),
-            TourStep(
-                id="keyboard_shortcuts",
-                title="Keyboard Shortcuts",
-                description="Press H on the Bracket tab to toggle instructions. Press T anytime to restart this tour. Press ESC to cancel editing or close dialogs.",
-                tab="Bracket",
-                highlight_rect=None,
-                action_required=None
-            ),
-            TourStep(
-                id="tour_complete",
-                title="Tour Complete!",
-                description="You've learned all the features! Press T anytime to replay this tour. Happy bracketing!",
-                tab="Tournaments",
-                highlight_rect=None,
-                action_required="Click 'Finish' to end tour"
-            )
-        ]
+        self.tour_steps = build_tour_steps(self.width, self.height, self.tab_height)
     
     def start_tour(self):
         """Start the user tour."""
@@ -1689,11 +2254,21 @@ class TournamentBracketGUI:
         self.tournaments_list = []
         
         try:
-            for filepath in self.tournaments_dir.glob("*.json"):
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    metadata = TournamentMetadata.from_dict(data["metadata"])
-                    self.tournaments_list.append(metadata)
+            # One scandir pass instead of a glob per format: entry names come
+            # straight from the directory read, no stat per file.
+            preferred = {}
+            with os.scandir(self.tournaments_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".mpk") and msgspec is not None:
+                        # .mpk supersedes a migrated tournament's .json
+                        preferred[name[:-4]] = entry.path
+                    elif name.endswith(".json"):
+                        preferred.setdefault(name[:-5], entry.path)
+            for filepath in preferred.values():
+                data = read_tournament_file(Path(filepath))
+                metadata = TournamentMetadata.from_dict(data["metadata"])
+                self.tournaments_list.append(metadata)
             
             # Sort by date created (newest first)
             self.tournaments_list.sort(key=lambda x: x.date_created, reverse=True)
@@ -1702,12 +2277,19 @@ class TournamentBracketGUI:
     
     def delete_tournament(self, tournament_id: str):
         """Delete a tournament."""
+        self._flush_pending_save()
         try:
-            filepath = self.tournaments_dir / f"{tournament_id}.json"
-            if filepath.exists():
-                filepath.unlink()
-                self.load_tournaments_list()
-                
+            deleted = False
+            for suffix in (".mpk", ".json"):
+                filepath = self.tournaments_dir / f"{tournament_id}{suffix}"
+                if filepath.exists():
+                    filepath.unlink()
+                    deleted = True
+            if deleted:
+                # Drop the entry in place; no need to re-read every file on disk
+                self.tournaments_list = [t for t in self.tournaments_list
+                                         if t.id != tournament_id]
+
                 if self.current_tournament_id == tournament_id:
                     self.current_tournament_id = None
                     self.current_metadata = None
@@ -1727,143 +2309,129 @@ class TournamentBracketGUI:
         
         # Check close confirmation dialog
         if self.show_close_confirm:
-            dialog_rect = pygame.Rect(self.width // 2 - 200, self.height // 2 - 80, 400, 160)
-            yes_button = pygame.Rect(self.width // 2 - 120, self.height // 2 + 20, 100, 40)
-            no_button = pygame.Rect(self.width // 2 + 20, self.height // 2 + 20, 100, 40)
-            
-            if yes_button.collidepoint(mx, my):
+            if self._dialog_yes_rect.collidepoint(mx, my):
                 self.save_current_tournament()
                 pygame.quit()
                 sys.exit()
-            elif no_button.collidepoint(mx, my):
+            elif self._dialog_no_rect.collidepoint(mx, my):
                 self.show_close_confirm = False
             return
         
-        # Current Tournament tab interactions
-        if self.active_tab == "Current Tournament":
-            # Check editable field clicks (only if we have a tournament)
-            if self.current_metadata:
-                y_offset = self.tab_height + 80
-                
-                # Tournament name field
-                name_rect = pygame.Rect(300, y_offset - 8, 500, 40)
-                if name_rect.collidepoint(mx, my):
-                    self.active_input_field = "tournament_name"
-                    self.input_text = self.current_metadata.name
-                    return
-                y_offset += 60
-                
-                # Location field
-                location_rect = pygame.Rect(300, y_offset - 8, 500, 40)
-                if location_rect.collidepoint(mx, my):
-                    self.active_input_field = "tournament_location"
-                    self.input_text = self.current_metadata.location
-                    return
-                y_offset += 60
-                
-                # Date field
-                date_rect = pygame.Rect(300, y_offset - 8, 250, 40)
-                if date_rect.collidepoint(mx, my):
-                    self.active_input_field = "tournament_date"
-                    self.input_text = self.current_metadata.date_scheduled
-                    return
-                
-                # Time field
-                time_rect = pygame.Rect(570, y_offset - 8, 230, 40)
-                if time_rect.collidepoint(mx, my):
-                    self.active_input_field = "tournament_time"
-                    self.input_text = self.current_metadata.time_scheduled
-                    return
-                
-                # Click outside editable fields - save and deactivate
-                if self.active_input_field:
-                    # Save the edited value
-                    if self.active_input_field == "tournament_name":
-                        self.current_metadata.name = self.input_text
-                    elif self.active_input_field == "tournament_location":
-                        self.current_metadata.location = self.input_text
-                    elif self.active_input_field == "tournament_date":
-                        self.current_metadata.date_scheduled = self.input_text
-                    elif self.active_input_field == "tournament_time":
-                        self.current_metadata.time_scheduled = self.input_text
-                    
-                    self.active_input_field = None
-                    self.input_text = ""
-                    self.save_current_tournament()
-            
-            # Check dangerous operations panel toggle
-            panel_toggle_rect = pygame.Rect(100, self.tab_height + 450, self.width - 200, 40)
-            if panel_toggle_rect.collidepoint(mx, my):
-                self.dangerous_panel_open = not self.dangerous_panel_open
+        handler = self._tab_click_handlers.get(self.active_tab)
+        if handler:
+            handler(pos)
+
+    def _click_current_tab(self, pos: Tuple[int, int]):
+        mx, my = pos
+        # Check editable field clicks (only if we have a tournament)
+        if self.current_metadata:
+            # Tournament name field
+            if self._edit_name_rect.collidepoint(mx, my):
+                self.active_input_field = "tournament_name"
+                self.input_text = self.current_metadata.name
+                return
+
+            # Location field
+            if self._edit_location_rect.collidepoint(mx, my):
+                self.active_input_field = "tournament_location"
+                self.input_text = self.current_metadata.location
+                return
+
+            # Date field
+            if self._edit_date_rect.collidepoint(mx, my):
+                self.active_input_field = "tournament_date"
+                self.input_text = self.current_metadata.date_scheduled
+                return
+
+            # Time field
+            if self._edit_time_rect.collidepoint(mx, my):
+                self.active_input_field = "tournament_time"
+                self.input_text = self.current_metadata.time_scheduled
                 return
             
-            # If panel is open, check for button clicks
-            if self.dangerous_panel_open:
-                reset_button_rect = pygame.Rect(self.width // 2 - 220, self.tab_height + 520, 200, 50)
-                reshuffle_button_rect = pygame.Rect(self.width // 2 + 20, self.tab_height + 520, 200, 50)
+            # Click outside editable fields - save and deactivate
+            if self.active_input_field:
+                # Save the edited value
+                if self.active_input_field == "tournament_name":
+                    self.current_metadata.name = self.input_text
+                elif self.active_input_field == "tournament_location":
+                    self.current_metadata.location = self.input_text
+                elif self.active_input_field == "tournament_date":
+                    self.current_metadata.date_scheduled = self.input_text
+                elif self.active_input_field == "tournament_time":
+                    self.current_metadata.time_scheduled = self.input_text
                 
-                if reset_button_rect.collidepoint(mx, my):
-                    self.reset_tournament()
-                    return
-                elif reshuffle_button_rect.collidepoint(mx, my):
-                    self.reshuffle_tournament()
-                    return
+                self.active_input_field = None
+                self.input_text = ""
+                self._queue_save()
         
-        # Player List tab interactions
-        elif self.active_tab == "Player List":
-            # Add player button
-            add_button_rect = pygame.Rect(self.width // 2 - 100, self.height - 120, 200, 50)
-            if add_button_rect.collidepoint(mx, my) and self.new_player_name.strip():
-                self.editing_players.append(self.new_player_name.strip())
-                self.new_player_name = ""
-                self._recalculate_scaling()
-                self.save_current_tournament()
+        # Check dangerous operations panel toggle
+        if self._panel_toggle_rect.collidepoint(mx, my):
+            self.dangerous_panel_open = not self.dangerous_panel_open
+            return
+
+        # If panel is open, check for button clicks
+        if self.dangerous_panel_open:
+            if self._reset_btn_rect.collidepoint(mx, my):
+                self.reset_tournament()
                 return
-            
-            # Generate bracket button
-            generate_button_rect = pygame.Rect(self.width // 2 - 120, self.height - 60, 240, 50)
-            if generate_button_rect.collidepoint(mx, my) and len(self.editing_players) >= 2:
-                self.generate_bracket()
+            elif self._reshuffle_btn_rect.collidepoint(mx, my):
+                self.reshuffle_tournament()
                 return
-            
-            # Remove player buttons (small X next to each player)
-            y_offset = self.tab_height + 180
-            for i in range(len(self.editing_players)):
-                remove_btn = pygame.Rect(self.width // 2 + 180, y_offset + i * 35, 30, 30)
-                if remove_btn.collidepoint(mx, my):
-                    self.editing_players.pop(i)
-                    self._recalculate_scaling()
-                    self.save_current_tournament()
-                    return
+
+    def _click_player_list_tab(self, pos: Tuple[int, int]):
+        mx, my = pos
+        # Add player button
+        if self._add_player_rect.collidepoint(mx, my) and self.new_player_name.strip():
+            self.editing_players.append(self.new_player_name.strip())
+            self.new_player_name = ""
+            self._recalculate_scaling()
+            self._queue_save()
             return
         
-        # Tournaments tab interactions
-        elif self.active_tab == "Tournaments":
-            # Create new tournament button
-            create_button_rect = pygame.Rect(self.width // 2 - 120, self.height - 80, 240, 50)
-            if create_button_rect.collidepoint(mx, my):
-                # For now, create with default values - could add a dialog later
-                import datetime
-                today = datetime.date.today()
-                self.create_new_tournament(
-                    f"Tournament {len(self.tournaments_list) + 1}",
-                    "TBD",
-                    today.isoformat(),
-                    "12:00"
-                )
+        # Generate bracket button
+        if self._generate_rect.collidepoint(mx, my) and len(self.editing_players) >= 2:
+            self.generate_bracket()
+            return
+        
+        # Remove player buttons (small X next to each player)
+        y_offset = self.tab_height + 180
+        for i in range(len(self.editing_players)):
+            remove_btn = pygame.Rect(self.width // 2 + 180, y_offset + i * 35, 30, 30)
+            if remove_btn.collidepoint(mx, my):
+                self.editing_players.pop(i)
+                self._recalculate_scaling()
+                self._queue_save()
                 return
-            
-            # Click on tournament to load it
-            y_offset = self.tab_height + 120
-            for i, tournament in enumerate(self.tournaments_list):
-                tournament_rect = pygame.Rect(100, y_offset + i * 80, self.width - 200, 70)
-                if tournament_rect.collidepoint(mx, my):
-                    self.load_tournament(tournament.id)
-                    return
+
+    def _click_tournaments_tab(self, pos: Tuple[int, int]):
+        mx, my = pos
+        # Create new tournament button
+        if self._create_tournament_rect.collidepoint(mx, my):
+            # For now, create with default values - could add a dialog later
+            import datetime
+            today = datetime.date.today()
+            self.create_new_tournament(
+                f"Tournament {len(self.tournaments_list) + 1}",
+                "TBD",
+                today.isoformat(),
+                "12:00"
+            )
             return
         
-        # Only handle bracket interactions on Bracket tab
-        if self.active_tab != "Bracket" or not self.bracket:
+        # Click on tournament to load it: the rows are a uniform
+        # 80px-pitch stack, so the index falls out of the arithmetic
+        # instead of a Rect per entry
+        row_top = my - (self.tab_height + 120)
+        if (100 <= mx < self.width - 100 and row_top >= 0
+                and row_top % 80 < 70):
+            idx = row_top // 80
+            if idx < len(self.tournaments_list):
+                self.load_tournament(self.tournaments_list[idx].id)
+
+    def _click_bracket_tab(self, pos: Tuple[int, int]):
+        mx, my = pos
+        if not self.bracket:
             return
         
         if self.selected_match:
@@ -1871,55 +2439,28 @@ class TournamentBracketGUI:
             match = self.bracket.matches[round_num - 1][match_idx]
             
             if not match.winner and match.player1 and match.player2:
-                round_spacing = (self.width - 100) / self.bracket.num_rounds
-                start_y = self.tab_height + 120
-                
-                x = 50 + round_num * round_spacing - round_spacing / 2
-                num_matches = len(self.bracket.matches[round_num - 1])
-                match_spacing = self._get_match_spacing(num_matches)
-                y = start_y + 50 + match_idx * match_spacing + self.scroll_offset
-                
-                box_rect = pygame.Rect(
-                    x - self.match_width // 2,
-                    y,
-                    self.match_width,
-                    self.match_height
-                )
-                
+                box_rect = self._match_rects[round_num - 1][match_idx].move(
+                    0, self.scroll_offset)
+
                 if box_rect.collidepoint(mx, my):
                     relative_y = my - box_rect.y
                     if relative_y < self.player_height and match.player1:
-                        self.bracket.set_match_winner(round_num, match_idx, match.player1)
-                        self.selected_match = None
-                        self.save_current_tournament()
+                        winner = match.player1
                     elif relative_y >= self.player_height and match.player2:
-                        self.bracket.set_match_winner(round_num, match_idx, match.player2)
-                        self.selected_match = None
-                        self.save_current_tournament()
+                        winner = match.player2
+                    else:
+                        return
+                    self.selected_match = None
+                    if self.record_winner(round_num, match_idx, winner):
+                        self._queue_save()
                     return
         
-        for round_num, round_matches in enumerate(self.bracket.matches, 1):
-            round_spacing = (self.width - 100) / self.bracket.num_rounds
-            start_y = self.tab_height + 120
-            
-            x = 50 + round_num * round_spacing - round_spacing / 2
-            num_matches = len(round_matches)
-            match_spacing = self._get_match_spacing(num_matches)
-            
-            for idx, match in enumerate(round_matches):
-                y = start_y + 50 + idx * match_spacing + self.scroll_offset
-                
-                box_rect = pygame.Rect(
-                    x - self.match_width // 2,
-                    y,
-                    self.match_width,
-                    self.match_height
-                )
-                
-                if box_rect.collidepoint(mx, my):
-                    if not match.winner and match.player1 and match.player2:
-                        self.selected_match = (round_num, idx)
-                    return
+        hit = self._match_at(mx, my)
+        if hit:
+            round_num, idx = hit
+            match = self.bracket.matches[round_num - 1][idx]
+            if not match.winner and match.player1 and match.player2:
+                self.selected_match = (round_num, idx)
     
     def _handle_hover(self, pos: Tuple[int, int]):
         mx, my = pos
@@ -1927,27 +2468,21 @@ class TournamentBracketGUI:
         
         # Check if hovering over close button
         self.hovered_close_button = self.close_button_rect.collidepoint(mx, my)
-        
+
+        # Match hover only exists on the Bracket tab with a selection
+        # pending; bail before any geometry for all other motion, which is
+        # the common case at MOUSEMOTION frequency.
+        if self.active_tab != "Bracket" or not self.bracket:
+            return
+
         if self.selected_match:
             round_num, match_idx = self.selected_match
             match = self.bracket.matches[round_num - 1][match_idx]
-            
+
             if not match.winner and match.player1 and match.player2:
-                round_spacing = (self.width - 100) / self.bracket.num_rounds
-                start_y = self.tab_height + 120
-                
-                x = 50 + round_num * round_spacing - round_spacing / 2
-                num_matches = len(self.bracket.matches[round_num - 1])
-                match_spacing = self._get_match_spacing(num_matches)
-                y = start_y + 50 + match_idx * match_spacing + self.scroll_offset
-                
-                box_rect = pygame.Rect(
-                    x - self.match_width // 2,
-                    y,
-                    self.match_width,
-                    self.match_height
-                )
-                
+                box_rect = self._match_rects[round_num - 1][match_idx].move(
+                    0, self.scroll_offset)
+
                 if box_rect.collidepoint(mx, my):
                     relative_y = my - box_rect.y
                     if relative_y < self.player_height: